@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import copy
+import io
+import json
+import os
+import queue
 import sys
 import threading
 import traceback
@@ -8,7 +12,7 @@ import re
 import webbrowser
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Callable, Dict
+from typing import Any, Callable, Iterator
 from tkinter import (
     BOTH,
     END,
@@ -47,10 +51,12 @@ from bomcheck_app.excel_processor import (
     format_quantity_text,
     normalize_part_no,
 )
+from bomcheck_app.json_utils import json_dumps, json_loads
 from bomcheck_app.models import ExecutionResult
 from bomcheck_app.part_assets import PartAsset, PartAssetStore, open_file
 from bomcheck_app.asset_crawler import AssetCrawler, CrawlStatus
 from bomcheck_app.system_parts import (
+    CategoryNode,
     SystemPartRecord,
     SystemPartRepository,
     generate_system_part_excel,
@@ -75,6 +81,44 @@ def _default_config_path() -> Path:
 
 CONFIG_PATH = _default_config_path()
 
+_BINDING_CACHE: dict[Path, tuple[int, int, tuple[BindingProject, ...]]] = {}
+
+
+def _load_binding_library(path: Path) -> BindingLibrary:
+    # 缓存只保存从磁盘解析出的项目，每次返回克隆，调用方的修改不会回流到缓存
+    try:
+        stat = path.stat()
+    except OSError:
+        _BINDING_CACHE.pop(path, None)
+        binding_library = BindingLibrary(path)
+        binding_library.load()
+        return binding_library
+    cached = _BINDING_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        binding_library = BindingLibrary(path)
+        binding_library.projects = [project.clone() for project in cached[2]]
+        return binding_library
+    binding_library = BindingLibrary(path)
+    binding_library.load()
+    _BINDING_CACHE[path] = (
+        stat.st_mtime_ns,
+        stat.st_size,
+        tuple(project.clone() for project in binding_library.projects),
+    )
+    return binding_library
+
+
+def _clear_treeview(tree: ttk.Treeview) -> None:
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+
+
+def _clear_treeview_selection(tree: ttk.Treeview) -> None:
+    selection = tree.selection()
+    if selection:
+        tree.selection_remove(selection)
+
 
 def position_window_near_cursor(window: Tk | Toplevel, offset: int = 24) -> None:
     try:
@@ -350,8 +394,7 @@ class Application:
 
     def _prepare_config(self, path: Path) -> dict:
         config = load_config(path)
-        binding_library = BindingLibrary(config.binding_library)
-        binding_library.load()
+        binding_library = _load_binding_library(config.binding_library)
         processor = ExcelProcessor(config)
         part_asset_store = PartAssetStore(config.part_asset_dir)
         account_store = AccountStore(config.account_store)
@@ -460,6 +503,8 @@ class Application:
     def _handle_data_file_save(self, new_config: AppConfig) -> None:
         try:
             save_config(self.config_path, new_config)
+            _BINDING_CACHE.pop(self.config.binding_library, None)
+            _BINDING_CACHE.pop(new_config.binding_library, None)
             self._apply_config(self.config_path)
         except Exception as exc:  # pragma: no cover - user feedback
             messagebox.showerror("保存失败", f"更新配置失败：{exc}")
@@ -497,9 +542,8 @@ class Application:
                 self._update_result_box(f"执行失败：{exc}\n{traceback.format_exc()}", success=False)
                 return
 
-            summary_lines = self._build_summary_lines(result)
             success = not result.has_missing
-            self._update_result_box("\n".join(summary_lines), success=success)
+            self._stream_result_box(self._iter_summary_chunks(result), success=success)
         finally:
             self.root.after(0, self._on_execution_complete)
 
@@ -518,6 +562,40 @@ class Application:
 
         self.root.after(0, update)
 
+    def _stream_result_box(self, chunks, success: bool) -> None:
+        # 分段投递结果文本，队列满时阻塞工作线程，避免事件循环被大量回调淹没
+        # 先清空结果框并设置底色，即使没有任何文本也不会残留上一次的结果
+        self.root.after(0, self._reset_result_box, success)
+        chunk_queue: queue.Queue[str] = queue.Queue(maxsize=64)
+        for chunk in chunks:
+            chunk_queue.put(chunk)
+            self.root.after(0, self._append_result_chunk, chunk_queue)
+
+    def _reset_result_box(self, success: bool) -> None:
+        self.result_text.delete(1.0, END)
+        self.result_text.configure(bg="#d4edda" if success else "#f8d7da")
+
+    def _append_result_chunk(self, chunk_queue: queue.Queue[str]) -> None:
+        try:
+            chunk = chunk_queue.get_nowait()
+        except queue.Empty:
+            return
+        self.result_text.insert(END, chunk)
+
+    def _iter_summary_chunks(self, result: ExecutionResult, size: int = 8192):
+        # 逐行写入缓冲区，攒够一段就投递，不构建完整的行列表或整段文本
+        buffer = io.StringIO()
+        for index, line in enumerate(self._iter_summary_lines(result)):
+            if index:
+                buffer.write("\n")
+            buffer.write(line)
+            if buffer.tell() >= size:
+                yield buffer.getvalue()
+                buffer = io.StringIO()
+        tail = buffer.getvalue()
+        if tail:
+            yield tail
+
     def _handle_save_error(self, error: SaveWorkbookError) -> None:
         decision_event = threading.Event()
         default_extension = error.path.suffix or ".xlsx"
@@ -683,40 +761,35 @@ class Application:
             repository.path if repository is not None else None
         )
 
-    def _build_summary_lines(self, result: ExecutionResult) -> list[str]:
-        lines = [
-            f"失效料号数量：{format_quantity_text(result.replacement_summary.total_invalid_found)}",
-            f"已标记失效料号数量：{format_quantity_text(result.replacement_summary.total_invalid_previously_marked)}",
-            f"已替换数量：{format_quantity_text(result.replacement_summary.total_replaced)}",
-        ]
-        lines.extend(self._summarize_binding_results(result))
-        lines.extend(self._summarize_missing_items(result))
-        lines.extend(self._summarize_important_hits(result))
-        lines.extend(self._summarize_debug_logs(result))
-        return lines
+    def _iter_summary_lines(self, result: ExecutionResult) -> Iterator[str]:
+        yield f"失效料号数量：{format_quantity_text(result.replacement_summary.total_invalid_found)}"
+        yield f"已标记失效料号数量：{format_quantity_text(result.replacement_summary.total_invalid_previously_marked)}"
+        yield f"已替换数量：{format_quantity_text(result.replacement_summary.total_replaced)}"
+        yield from self._summarize_binding_results(result)
+        yield from self._summarize_missing_items(result)
+        yield from self._summarize_important_hits(result)
+        yield from self._summarize_debug_logs(result)
 
-    def _summarize_binding_results(self, result: ExecutionResult) -> list[str]:
+    def _summarize_binding_results(self, result: ExecutionResult) -> Iterator[str]:
         binding_group_count = sum(
             len(res.requirement_results) for res in result.binding_results
         )
-        lines = [
-            "",
-            (
-                "绑定料号统计：找到 "
-                f"{format_quantity_text(len(result.binding_results))} 组项目，"
-                f"需求分组 {format_quantity_text(binding_group_count)} 组"
-            ),
-        ]
+        yield ""
+        yield (
+            "绑定料号统计：找到 "
+            f"{format_quantity_text(len(result.binding_results))} 组项目，"
+            f"需求分组 {format_quantity_text(binding_group_count)} 组"
+        )
         if not result.binding_results:
-            lines.append("（未找到匹配的绑定项目）")
-            return lines
+            yield "（未找到匹配的绑定项目）"
+            return
 
         for binding_result in result.binding_results:
             project_header = (
                 f"- {binding_result.project_desc} ({binding_result.index_part_no})，"
                 f"主料数量：{format_quantity_text(binding_result.matched_quantity)}"
             )
-            lines.append(project_header)
+            yield project_header
 
             for group_result in binding_result.requirement_results:
                 group_line = (
@@ -725,59 +798,51 @@ class Application:
                     + f"可用 {format_quantity_text(group_result.available_qty)}，"
                     + f"缺少 {format_quantity_text(group_result.missing_qty)}"
                 )
-                lines.append(group_line)
+                yield group_line
 
                 if group_result.matched_details:
                     matched_pairs = [
                         f"{part}:{format_quantity_text(qty)}"
                         for part, qty in group_result.matched_details.items()
                     ]
-                    lines.append("    满足料号：" + ", ".join(matched_pairs))
+                    yield "    满足料号：" + ", ".join(matched_pairs)
 
                 if group_result.missing_choices:
-                    lines.append(
-                        "    缺少料号：" + ", ".join(group_result.missing_choices)
-                    )
-
-        return lines
+                    yield "    缺少料号：" + ", ".join(group_result.missing_choices)
 
-    def _summarize_missing_items(self, result: ExecutionResult) -> list[str]:
+    def _summarize_missing_items(self, result: ExecutionResult) -> Iterator[str]:
         if not result.missing_items:
-            return []
+            return
 
-        lines = ["", "缺失物料："]
+        yield ""
+        yield "缺失物料："
         for item in result.missing_items:
-            lines.append(
-                f"- {item.part_no} {item.desc} 缺少 {format_quantity_text(item.missing_qty)}"
-            )
-        return lines
+            yield f"- {item.part_no} {item.desc} 缺少 {format_quantity_text(item.missing_qty)}"
 
-    def _summarize_important_hits(self, result: ExecutionResult) -> list[str]:
-        lines = [
-            "",
-            f"重要物料统计：找到 {format_quantity_text(len(result.important_hits))} 组",
-        ]
+    def _summarize_important_hits(self, result: ExecutionResult) -> Iterator[str]:
+        yield ""
+        yield f"重要物料统计：找到 {format_quantity_text(len(result.important_hits))} 组"
         if not result.important_hits:
-            lines.append("（无重要物料命中）")
-            return lines
+            yield "（无重要物料命中）"
+            return
 
         for hit in result.important_hits:
-            lines.append(
-                f"- {hit.keyword}（{hit.converted_keyword}）：{format_quantity_text(hit.total_quantity)}"
-            )
+            yield f"- {hit.keyword}（{hit.converted_keyword}）：{format_quantity_text(hit.total_quantity)}"
             if hit.matched_parts:
                 matched_text = ", ".join(
                     f"{part}:{format_quantity_text(qty)}"
                     for part, qty in hit.matched_parts.items()
                 )
-                lines.append(f"    命中料号：{matched_text}")
-        return lines
+                yield f"    命中料号：{matched_text}"
 
-    def _summarize_debug_logs(self, result: ExecutionResult) -> list[str]:
+    def _summarize_debug_logs(self, result: ExecutionResult) -> Iterator[str]:
         if not result.debug_logs:
-            return []
+            return
 
-        return ["", "调试信息：", *[f"- {log}" for log in result.debug_logs]]
+        yield ""
+        yield "调试信息："
+        for log in result.debug_logs:
+            yield f"- {log}"
 
 
 class DataFileEditor:
@@ -1028,21 +1093,13 @@ class DataFileEditor:
             )
             return
 
-        if not source.exists():
-            messagebox.showerror(
-                "处理失败",
-                f"未找到系统料号原始文件：{source}",
-                **self._dialog_kwargs,
-            )
+        if not self._require_file(source, "未找到系统料号原始文件"):
             return
-        if not invalid.exists():
-            messagebox.showerror(
-                "处理失败", f"未找到失效料号数据库：{invalid}", **self._dialog_kwargs
-            )
+        if not self._require_file(invalid, "未找到失效料号数据库"):
             return
         blocked.parent.mkdir(parents=True, exist_ok=True)
-        if not blocked.exists():
-            blocked.touch()
+        # 以追加模式打开：文件不存在时创建，已存在时不改动内容和修改时间
+        open(blocked, "ab").close()
 
         try:
             excel_path, fast_path = generate_system_part_exports(
@@ -1061,6 +1118,16 @@ class DataFileEditor:
             **self._dialog_kwargs,
         )
 
+    def _require_file(self, path: Path, message: str) -> bool:
+        try:
+            path.stat()
+        except FileNotFoundError:
+            messagebox.showerror(
+                "处理失败", f"{message}：{path}", **self._dialog_kwargs
+            )
+            return False
+        return True
+
     def _normalize_path(self, raw_path: str) -> Path:
         path = Path(raw_path)
         if not path.is_absolute():
@@ -1335,7 +1402,12 @@ class SystemPartViewer(Frame):
         query = self.search_var.get().strip()
         hierarchy = self.repository.build_hierarchy(query or None)
         self._clear_tree()
-        self._insert_nodes("", hierarchy)
+        # 隐藏列布局后再批量插入，避免 Tk 在每次插入后重新计算列
+        self.tree.configure(displaycolumns=())
+        try:
+            self._insert_nodes("", hierarchy)
+        finally:
+            self.tree.configure(displaycolumns="#all")
         total = len(self.repository.records)
         if query:
             matched = len(self.repository.search(query))
@@ -1345,8 +1417,9 @@ class SystemPartViewer(Frame):
             self.status_var.set(f"共 {total} 条")
 
     def _clear_tree(self) -> None:
-        for item in self.tree.get_children(""):
-            self.tree.delete(item)
+        children = self.tree.get_children("")
+        if children:
+            self.tree.delete(*children)
 
     def _on_tree_right_click(self, event) -> str | None:
         item = self.tree.identify_row(event.y)
@@ -1860,10 +1933,10 @@ class SystemPartViewer(Frame):
         else:
             self._cancel_preview(destroy_window=True, force=True)
 
-    def _insert_nodes(self, parent: str, node: Dict[str, Dict], depth: int = 1) -> None:
+    def _insert_nodes(self, parent: str, node: CategoryNode, depth: int = 1) -> None:
         for category, child in self._iter_collapsed_children(node, depth):
             if self._should_skip_category(child):
-                for record in child.get("parts", []):
+                for record in child.parts:
                     self._insert_part(parent, record)
                 continue
             tags = ("category", f"category-level-{depth}")
@@ -1876,7 +1949,7 @@ class SystemPartViewer(Frame):
             else:
                 self._insert_nodes(item_id, child, depth + 1)
         if depth <= self._max_category_depth:
-            for record in node.get("parts", []):
+            for record in node.parts:
                 self._insert_part(parent, record)
 
     def _insert_part(self, parent: str, record: SystemPartRecord) -> None:
@@ -1897,30 +1970,31 @@ class SystemPartViewer(Frame):
     def _max_category_depth(self) -> int:
         return 4
 
-    def _iter_collapsed_children(self, node: Dict[str, Dict], depth: int) -> list[tuple[str, Dict]]:
-        children = node.get("children", {})
-        collapsed: list[tuple[str, Dict]] = []
+    def _iter_collapsed_children(
+        self, node: CategoryNode, depth: int
+    ) -> list[tuple[str, CategoryNode]]:
+        children = node.children
+        collapsed: list[tuple[str, CategoryNode]] = []
         for category in sorted(children):
             collapsed.append(self._collapse_category_path(category, children[category]))
         return collapsed
 
     def _collapse_category_path(
-        self, label: str, node: Dict[str, Dict]
-    ) -> tuple[str, Dict[str, Dict]]:
+        self, label: str, node: CategoryNode
+    ) -> tuple[str, CategoryNode]:
         current_label = label
         current_node = node
-        while (
-            not current_node.get("parts")
-            and len(current_node.get("children", {})) == 1
-        ):
-            next_label, next_node = next(iter(current_node["children"].items()))
+        while True:
+            children = current_node.children
+            if current_node.parts or len(children) != 1:
+                break
+            next_label, current_node = next(iter(children.items()))
             current_label = f"{current_label} / {next_label}"
-            current_node = next_node
         return current_label, current_node
 
-    def _collect_all_parts(self, node: Dict[str, Dict]) -> list[SystemPartRecord]:
-        parts = list(node.get("parts", []))
-        for child in node.get("children", {}).values():
+    def _collect_all_parts(self, node: CategoryNode) -> list[SystemPartRecord]:
+        parts = list(node.parts)
+        for child in node.children.values():
             parts.extend(self._collect_all_parts(child))
         return parts
 
@@ -1933,8 +2007,8 @@ class SystemPartViewer(Frame):
         for item in self.tree.get_children(""):
             expand(item)
 
-    def _should_skip_category(self, node: Dict[str, Dict]) -> bool:
-        return not node.get("children") and len(node.get("parts", [])) == 1
+    def _should_skip_category(self, node: CategoryNode) -> bool:
+        return not node.children and len(node.parts) == 1
 
     def _get_filtered_records(self) -> list[SystemPartRecord]:
         if not self.repository:
@@ -1945,9 +2019,8 @@ class SystemPartViewer(Frame):
         return list(self.repository.records)
 
     def _export_to_excel(self, path: str, records: list[SystemPartRecord]) -> None:
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.title = "系统料号"
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("系统料号")
         sheet.append(["料号", "描述", "单位", "申请人", "库存"])
         for record in records:
             sheet.append(
@@ -2255,7 +2328,9 @@ class InvalidPartEditor:
         self.entries = []
         try:
             if self.path.exists():
-                workbook = load_workbook(self.path, data_only=True)
+                workbook = load_workbook(
+                    self.path, read_only=True, data_only=True, keep_links=False
+                )
                 sheet = workbook.active
                 for row in sheet.iter_rows(min_row=2, values_only=True):
                     if not row:
@@ -2568,9 +2643,8 @@ class InvalidPartEditor:
                 "保存失败", f"创建目录失败：{exc}", **self._dialog_kwargs
             )
             return
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.title = "失效料号"
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("失效料号")
         sheet.append(["失效料号", "失效描述", "替换料号", "替换描述"])
         for entry in cleaned_entries:
             if not any(
@@ -2886,22 +2960,29 @@ class BlockedApplicantEditor:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             if not self.path.exists():
                 self.path.touch()
-            content = self.path.read_text(encoding="utf-8")
+            self.text.delete(1.0, END)
+            with open(self.path, "r", encoding="utf-8") as handle:
+                while True:
+                    chunk = handle.read(1 << 16)
+                    if not chunk:
+                        break
+                    self.text.insert(END, chunk)
         except Exception as exc:  # pragma: no cover - user feedback
             messagebox.showerror(
                 "加载失败", f"读取屏蔽申请人失败：{exc}", **self._dialog_kwargs
             )
-            content = ""
-        self.text.delete(1.0, END)
-        self.text.insert(END, content)
+            self.text.delete(1.0, END)
 
     def _save_content(self) -> None:
-        content = self.text.get("1.0", END)
-        if content.endswith("\n"):
-            content = content[:-1]
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
         try:
-            self.path.write_text(content, encoding="utf-8")
+            # 按文本段流式写入临时文件后整体替换，中途失败不会留下半截文件
+            with open(temp_path, "w", encoding="utf-8", buffering=1 << 20) as handle:
+                for _key, chunk, _index in self.text.dump("1.0", "end-1c", text=True):
+                    handle.write(chunk)
+            os.replace(temp_path, self.path)
         except Exception as exc:  # pragma: no cover - user feedback
+            temp_path.unlink(missing_ok=True)
             messagebox.showerror(
                 "保存失败", f"写入屏蔽申请人失败：{exc}", **self._dialog_kwargs
             )
@@ -2913,8 +2994,42 @@ class BlockedApplicantEditor:
             self.on_close()
         self.top.destroy()
 
+def _safe_float(raw: str, default: float | None) -> float | None:
+    text = raw.strip()
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _format_json_text(content: str) -> str:
+    return json_dumps(json_loads(content)).decode("utf-8")
+
+
+def _project_display(project: BindingProject) -> str:
+    return f"{project.project_desc or '未命名'} ({project.index_part_no or '-'})"
+
+
+def _group_display(group: BindingGroup) -> str:
+    return f"{group.group_name or '未命名'} (需求:{group.number})"
+
+
+def _choice_row_values(choice: BindingChoice) -> tuple:
+    return (
+        choice.part_no,
+        choice.desc,
+        choice.condition_mode or "",
+        choice.joined_conditions,
+        choice.number if choice.number is not None else "",
+    )
+
+
 class BindingEditor:
     CONDITION_MODE_OPTIONS = ("", "ALL", "ANY", "NOTANY")
+    CHOICE_BATCH_SIZE = 100
+    PROJECT_BATCH_SIZE = 500
 
     def __init__(
         self,
@@ -2939,6 +3054,15 @@ class BindingEditor:
         self.project_clipboard: BindingProject | None = None
         self.group_clipboard: BindingGroup | None = None
         self._suspend_part_lookup = False
+        self._project_dirty = False
+        self._group_dirty = False
+        self._condition_dirty = False
+        self._condition_mode_values = list(self.CONDITION_MODE_OPTIONS)
+        self._choice_fill_generation = 0
+        self._choice_rows_loaded = 0
+        self._project_fill_generation = 0
+        self._project_rows_loaded = 0
+        self._io_thread: threading.Thread | None = None
         self._build_ui()
         self._load_data()
         position_window_near_cursor(self.top)
@@ -2953,8 +3077,10 @@ class BindingEditor:
         Label(project_frame, text="项目列表").pack(anchor="w")
         project_list_container = Frame(project_frame)
         project_list_container.pack(fill=Y, expand=True)
+        self.project_items_var = StringVar()
         self.project_list = Listbox(
             project_list_container,
+            listvariable=self.project_items_var,
             exportselection=False,
             height=15,
             activestyle="none",
@@ -2991,6 +3117,8 @@ class BindingEditor:
         Entry(basic_frame, textvariable=self.project_index_desc_var).grid(row=2, column=1, sticky="ew")
         self.project_index_var.trace_add("write", self._on_project_index_change)
         self.project_index_desc_var.trace_add("write", self._on_project_index_desc_edit)
+        for var in (self.project_desc_var, self.project_index_var, self.project_index_desc_var):
+            var.trace_add("write", self._mark_project_dirty)
         basic_frame.columnconfigure(1, weight=1)
 
         # Groups
@@ -3001,8 +3129,10 @@ class BindingEditor:
         Label(group_left, text="需求分组").pack(anchor="w")
         group_list_container = Frame(group_left)
         group_list_container.pack(fill=Y, expand=True)
+        self.group_items_var = StringVar()
         self.group_list = Listbox(
             group_list_container,
+            listvariable=self.group_items_var,
             exportselection=False,
             height=10,
             activestyle="none",
@@ -3028,6 +3158,8 @@ class BindingEditor:
         Label(group_detail, text="需求数量：").grid(row=1, column=0, sticky="w")
         self.group_number_var = StringVar()
         Entry(group_detail, textvariable=self.group_number_var).grid(row=1, column=1, sticky="ew")
+        self.group_name_var.trace_add("write", self._mark_group_dirty)
+        self.group_number_var.trace_add("write", self._mark_group_dirty)
         group_detail.columnconfigure(1, weight=1)
 
         # Choices table
@@ -3075,6 +3207,7 @@ class BindingEditor:
         Label(choice_edit, text="条件料号：").grid(row=3, column=0, sticky="w")
         self.choice_condition_var = StringVar()
         Entry(choice_edit, textvariable=self.choice_condition_var).grid(row=3, column=1, sticky="ew")
+        self.choice_condition_var.trace_add("write", self._mark_condition_dirty)
         Label(choice_edit, text="数量：").grid(row=4, column=0, sticky="w")
         self.choice_number_var = StringVar()
         Entry(choice_edit, textvariable=self.choice_number_var).grid(row=4, column=1, sticky="ew")
@@ -3089,12 +3222,24 @@ class BindingEditor:
         # Bottom action buttons
         button_frame = Frame(self.top)
         button_frame.pack(fill=BOTH, padx=10, pady=5)
-        Button(button_frame, text="保存", command=self._save).pack(side=LEFT)
-        Button(button_frame, text="重新载入", command=self._load_data).pack(side=LEFT, padx=5)
-        Button(button_frame, text="导入Excel", command=self._import_excel).pack(side=LEFT, padx=5)
-        Button(button_frame, text="导出Excel", command=self._export_excel).pack(side=LEFT, padx=5)
+        self.save_button = Button(button_frame, text="保存", command=self._save)
+        self.save_button.pack(side=LEFT)
+        Button(button_frame, text="重新载入", command=self._reload_data).pack(side=LEFT, padx=5)
+        self.import_button = Button(button_frame, text="导入Excel", command=self._import_excel)
+        self.import_button.pack(side=LEFT, padx=5)
+        self.export_button = Button(button_frame, text="导出Excel", command=self._export_excel)
+        self.export_button.pack(side=LEFT, padx=5)
         Button(button_frame, text="关闭", command=self._handle_close).pack(side=RIGHT)
 
+    def _mark_project_dirty(self, *_args) -> None:
+        self._project_dirty = True
+
+    def _mark_group_dirty(self, *_args) -> None:
+        self._group_dirty = True
+
+    def _mark_condition_dirty(self, *_args) -> None:
+        self._condition_dirty = True
+
     def _on_project_index_change(self, *_args) -> None:
         if self._suspend_part_lookup:
             return
@@ -3141,9 +3286,18 @@ class BindingEditor:
         self._suspend_part_lookup = False
         self._commit_choice_fields()
 
+    def _reload_data(self) -> None:
+        # 后台保存或导入期间文件仍在写入，等待完成后再读取
+        if self._io_busy():
+            return
+        self._load_data()
+
     def _load_data(self) -> None:
         self.binding_library.load()
-        self.projects = [BindingProject.from_dict(project.to_dict()) for project in self.binding_library.iter_projects()]
+        self._show_library_projects()
+
+    def _show_library_projects(self) -> None:
+        self.projects = [project.clone() for project in self.binding_library.iter_projects()]
         self.selected_project_index = None
         self.selected_group_index = None
         self.selected_choice_index = None
@@ -3156,9 +3310,33 @@ class BindingEditor:
 
     def _refresh_project_list(self) -> None:
         self.project_list.delete(0, END)
-        for project in self.projects:
-            display = f"{project.project_desc or '未命名'} ({project.index_part_no or '-'})"
-            self.project_list.insert(END, display)
+        # 大量项目时先插入首批，其余在空闲时分批追加，保持界面响应
+        self._project_fill_generation += 1
+        self._project_rows_loaded = 0
+        self._fill_project_rows(self.PROJECT_BATCH_SIZE)
+        if self._project_rows_loaded < len(self.projects):
+            self.top.after_idle(self._fill_remaining_project_rows, self._project_fill_generation)
+
+    def _fill_project_rows(self, stop: int) -> None:
+        start = self._project_rows_loaded
+        stop = min(stop, len(self.projects))
+        if start >= stop:
+            return
+        self.project_list.insert(
+            END, *[_project_display(project) for project in self.projects[start:stop]]
+        )
+        self._project_rows_loaded = stop
+
+    def _fill_remaining_project_rows(self, generation: int) -> None:
+        if generation != self._project_fill_generation:
+            return
+        self._fill_project_rows(self._project_rows_loaded + self.PROJECT_BATCH_SIZE)
+        if self._project_rows_loaded < len(self.projects):
+            self.top.after_idle(self._fill_remaining_project_rows, generation)
+
+    def _select_project_row(self, index: int) -> None:
+        self._fill_project_rows(index + 1)
+        self.project_list.selection_set(index)
 
     def _ensure_project_visible(self, index: int) -> None:
         if 0 <= index < self.project_list.size():
@@ -3172,8 +3350,7 @@ class BindingEditor:
         self.group_list.delete(0, END)
         self.group_name_var.set("")
         self.group_number_var.set("")
-        for item in self.choice_tree.get_children():
-            self.choice_tree.delete(item)
+        self._clear_choice_rows()
         self.choice_part_var.set("")
         self.choice_desc_var.set("")
         self.choice_mode_var.set("")
@@ -3199,43 +3376,48 @@ class BindingEditor:
         self.project_index_var.set(project.index_part_no)
         self.project_index_desc_var.set(project.index_part_desc)
         self._suspend_part_lookup = False
+        self._project_dirty = False
         if project.index_part_no and not self.project_index_desc_var.get().strip():
             self._auto_fill_project_index_desc()
         self._refresh_group_list()
 
     def _commit_project_fields(self) -> None:
-        if self.selected_project_index is None:
+        if self.selected_project_index is None or not self._project_dirty:
             return
+        self._project_dirty = False
         project = self.projects[self.selected_project_index]
         project.project_desc = self.project_desc_var.get().strip()
         project.index_part_no = self.project_index_var.get().strip()
         project.index_part_desc = self.project_index_desc_var.get().strip()
-        display = f"{project.project_desc or '未命名'} ({project.index_part_no or '-'})"
-        if 0 <= self.selected_project_index < self.project_list.size():
-            current_selection = self.project_list.curselection()
-            preserve_selection = (
-                len(current_selection) == 1
-                and current_selection[0] == self.selected_project_index
-            )
-            self.project_list.delete(self.selected_project_index)
-            self.project_list.insert(self.selected_project_index, display)
-            if preserve_selection:
-                self.project_list.selection_clear(0, END)
-                self.project_list.selection_set(self.selected_project_index)
-                self._ensure_project_visible(self.selected_project_index)
+        display = _project_display(project)
+        if self._replace_list_row(
+            self.project_list, self.project_items_var, self.selected_project_index, display
+        ):
+            self._ensure_project_visible(self.selected_project_index)
+
+    def _replace_list_row(
+        self, listbox: Listbox, items_var: StringVar, index: int, display: str
+    ) -> bool:
+        # 通过 listvariable 原地改写该行，一次 Tcl 调用且保留选中状态
+        if not 0 <= index < listbox.size():
+            return False
+        if listbox.get(index) == display:
+            return False
+        self.top.tk.call("lset", str(items_var), index, display)
+        return listbox.selection_includes(index)
 
     def _refresh_group_list(self) -> None:
         self.group_list.delete(0, END)
         self.selected_group_index = None
         self.selected_choice_index = None
-        for group in self.projects[self.selected_project_index].required_groups:
-            display = f"{group.group_name or '未命名'} (需求:{group.number})"
-            self.group_list.insert(END, display)
+        groups = self.projects[self.selected_project_index].required_groups
+        displays = [_group_display(group) for group in groups]
+        if displays:
+            self.group_list.insert(END, *displays)
         self.group_name_var.set("")
         self.group_number_var.set("")
-        for item in self.choice_tree.get_children():
-            self.choice_tree.delete(item)
-        if self.projects[self.selected_project_index].required_groups:
+        self._clear_choice_rows()
+        if groups:
             self.group_list.selection_set(0)
             self._ensure_group_visible(0)
             self._on_group_select()
@@ -3260,44 +3442,40 @@ class BindingEditor:
         group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
         self.group_name_var.set(group.group_name)
         self.group_number_var.set(str(group.number))
+        self._group_dirty = False
         self._refresh_choice_list(auto_select_first=True)
 
     def _commit_group_fields(self) -> None:
-        if self.selected_project_index is None or self.selected_group_index is None:
+        if (
+            self.selected_project_index is None
+            or self.selected_group_index is None
+            or not self._group_dirty
+        ):
             return
+        self._group_dirty = False
         group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
         group.group_name = self.group_name_var.get().strip()
-        try:
-            group.number = float(self.group_number_var.get()) if self.group_number_var.get().strip() else 1.0
-        except ValueError:
-            group.number = 1.0
-        display = f"{group.group_name or '未命名'} (需求:{group.number})"
-        current_selection = self.group_list.curselection()
-        preserve_selection = self.selected_group_index in current_selection
-        if 0 <= self.selected_group_index < self.group_list.size():
-            self.group_list.delete(self.selected_group_index)
-            self.group_list.insert(self.selected_group_index, display)
-            if preserve_selection:
-                self.group_list.selection_set(self.selected_group_index)
-                self._ensure_group_visible(self.selected_group_index)
+        group.number = _safe_float(self.group_number_var.get(), 1.0)
+        display = _group_display(group)
+        if self._replace_list_row(
+            self.group_list, self.group_items_var, self.selected_group_index, display
+        ):
+            self._ensure_group_visible(self.selected_group_index)
 
     def _refresh_choice_list(self, auto_select_first: bool = False) -> None:
-        self.choice_tree.selection_remove(self.choice_tree.selection())
-        for item in self.choice_tree.get_children():
-            self.choice_tree.delete(item)
+        _clear_treeview_selection(self.choice_tree)
+        self._clear_choice_rows()
         group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
-        for idx, choice in enumerate(group.choices):
-            self.choice_tree.insert(
-                "",
-                "end",
-                iid=str(idx),
-                values=(
-                    choice.part_no,
-                    choice.desc,
-                    choice.condition_mode or "",
-                    ",".join(choice.condition_part_nos),
-                    choice.number if choice.number is not None else "",
-                ),
+        # 先插入首屏附近的行，其余行在空闲时分批补齐；
+        # 只在同步插入首批时隐藏列布局，空闲批次不再反复触发整表重排
+        self.choice_tree.configure(displaycolumns=())
+        try:
+            self._fill_choice_rows(group.choices, self.CHOICE_BATCH_SIZE)
+        finally:
+            self.choice_tree.configure(displaycolumns="#all")
+        if self._choice_rows_loaded < len(group.choices):
+            self.top.after_idle(
+                self._fill_remaining_choice_rows, self._choice_fill_generation, group.choices
             )
         self._clear_choice_fields()
         if auto_select_first and group.choices:
@@ -3305,15 +3483,45 @@ class BindingEditor:
             self.choice_tree.focus(first_id)
             self.choice_tree.selection_set(first_id)
             self._on_choice_select()
-        self.choice_tree.update_idletasks()
+
+    def _clear_choice_rows(self) -> None:
+        self._choice_fill_generation += 1
+        self._choice_rows_loaded = 0
+        _clear_treeview(self.choice_tree)
+
+    def _fill_choice_rows(self, choices: list[BindingChoice], stop: int) -> None:
+        start = self._choice_rows_loaded
+        stop = min(stop, len(choices))
+        if start >= stop:
+            return
+        for idx in range(start, stop):
+            self.choice_tree.insert(
+                "", "end", iid=str(idx), values=_choice_row_values(choices[idx])
+            )
+        self._choice_rows_loaded = stop
+
+    def _fill_remaining_choice_rows(
+        self, generation: int, choices: list[BindingChoice]
+    ) -> None:
+        if generation != self._choice_fill_generation:
+            return
+        self._fill_choice_rows(choices, self._choice_rows_loaded + self.CHOICE_BATCH_SIZE)
+        if self._choice_rows_loaded < len(choices):
+            self.top.after_idle(self._fill_remaining_choice_rows, generation, choices)
+
+    def _ensure_choice_row(self, index: int) -> None:
+        group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
+        self._fill_choice_rows(group.choices, index + 1)
 
     def _clear_choice_fields(self) -> None:
-        self.choice_tree.selection_remove(self.choice_tree.selection())
+        _clear_treeview_selection(self.choice_tree)
         self.choice_tree.focus("")
         self._suspend_part_lookup = True
         self.choice_part_var.set("")
         self.choice_desc_var.set("")
-        self.choice_mode_combo.configure(values=self.CONDITION_MODE_OPTIONS)
+        if len(self._condition_mode_values) != len(self.CONDITION_MODE_OPTIONS):
+            self._condition_mode_values = list(self.CONDITION_MODE_OPTIONS)
+            self.choice_mode_combo.configure(values=self._condition_mode_values)
         self._set_choice_mode_value("")
         self.choice_condition_var.set("")
         self.choice_number_var.set("")
@@ -3329,9 +3537,8 @@ class BindingEditor:
             self._clear_choice_fields()
             return
         self.selected_choice_index = int(selection[0])
-        choice = self.projects[self.selected_project_index].required_groups[self.selected_group_index].choices[
-            self.selected_choice_index
-        ]
+        groups = self.projects[self.selected_project_index].required_groups
+        choice = groups[self.selected_group_index].choices[self.selected_choice_index]
         self._suspend_part_lookup = True
         self.choice_part_var.set(choice.part_no)
         self.choice_desc_var.set(choice.desc)
@@ -3339,17 +3546,17 @@ class BindingEditor:
         if choice.part_no and not self.choice_desc_var.get().strip():
             self._auto_fill_choice_desc()
         self._set_choice_mode_value(choice.condition_mode or "")
-        self.choice_condition_var.set(",".join(choice.condition_part_nos))
+        self.choice_condition_var.set(choice.joined_conditions)
+        self._condition_dirty = False
         self.choice_number_var.set("" if choice.number is None else str(choice.number))
 
     def _set_choice_mode_value(self, value: str) -> None:
         if not hasattr(self, "choice_mode_combo"):
             self.choice_mode_var.set(value)
             return
-        current_values = list(self.choice_mode_combo.cget("values"))
-        if value not in current_values:
-            current_values.append(value)
-            self.choice_mode_combo.configure(values=current_values)
+        if value not in self._condition_mode_values:
+            self._condition_mode_values.append(value)
+            self.choice_mode_combo.configure(values=self._condition_mode_values)
         self.choice_mode_var.set(value)
 
     def _commit_choice_fields(self) -> None:
@@ -3366,22 +3573,16 @@ class BindingEditor:
         choice.part_no = self.choice_part_var.get().strip()
         choice.desc = self.choice_desc_var.get().strip()
         choice.condition_mode = self.choice_mode_var.get().strip() or None
-        condition_raw = self.choice_condition_var.get().strip()
-        choice.condition_part_nos = [item.strip() for item in condition_raw.split(",") if item.strip()]
-        try:
-            choice.number = float(self.choice_number_var.get()) if self.choice_number_var.get().strip() else None
-        except ValueError:
-            choice.number = None
-        values = (
-            choice.part_no,
-            choice.desc,
-            choice.condition_mode or "",
-            ",".join(choice.condition_part_nos),
-            choice.number if choice.number is not None else "",
-        )
+        if self._condition_dirty:
+            condition_raw = self.choice_condition_var.get().strip()
+            choice.condition_part_nos = [
+                item.strip() for item in condition_raw.split(",") if item.strip()
+            ]
+            self._condition_dirty = False
+        choice.number = _safe_float(self.choice_number_var.get(), None)
         item_id = str(self.selected_choice_index)
-        if item_id in self.choice_tree.get_children():
-            self.choice_tree.item(item_id, values=values)
+        if self.choice_tree.exists(item_id):
+            self.choice_tree.item(item_id, values=_choice_row_values(choice))
 
     def _add_project(self) -> None:
         self._commit_all()
@@ -3390,7 +3591,7 @@ class BindingEditor:
         self._refresh_project_list()
         self.project_list.selection_clear(0, END)
         new_index = len(self.projects) - 1
-        self.project_list.selection_set(new_index)
+        self._select_project_row(new_index)
         self._ensure_project_visible(new_index)
         self.project_list.event_generate("<<ListboxSelect>>")
 
@@ -3405,7 +3606,7 @@ class BindingEditor:
         self.selected_project_index = None
         if self.projects:
             new_index = min(index, len(self.projects) - 1)
-            self.project_list.selection_set(new_index)
+            self._select_project_row(new_index)
             self._ensure_project_visible(new_index)
             self._on_project_select()
 
@@ -3422,12 +3623,15 @@ class BindingEditor:
             self.projects[target_index],
             self.projects[index],
         )
-        self._refresh_project_list()
+        for row in (index, target_index):
+            self._replace_list_row(
+                self.project_list, self.project_items_var, row, _project_display(self.projects[row])
+            )
         self.selected_project_index = None
         self.selected_group_index = None
         self.selected_choice_index = None
         self.project_list.selection_clear(0, END)
-        self.project_list.selection_set(target_index)
+        self._select_project_row(target_index)
         self._ensure_project_visible(target_index)
         self._on_project_select()
 
@@ -3437,19 +3641,19 @@ class BindingEditor:
             return
         self._commit_all()
         project = self.projects[self.selected_project_index]
-        self.project_clipboard = BindingProject.from_dict(project.to_dict())
+        self.project_clipboard = project.clone()
 
     def _paste_project(self) -> None:
         if self.project_clipboard is None:
             messagebox.showwarning("提示", "请先复制项目", **self._dialog_kwargs)
             return
         self._commit_all()
-        new_project = BindingProject.from_dict(self.project_clipboard.to_dict())
+        new_project = self.project_clipboard.clone()
         self.projects.append(new_project)
         self._refresh_project_list()
         new_index = len(self.projects) - 1
         self.project_list.selection_clear(0, END)
-        self.project_list.selection_set(new_index)
+        self._select_project_row(new_index)
         self._ensure_project_visible(new_index)
         self.project_list.event_generate("<<ListboxSelect>>")
 
@@ -3460,10 +3664,10 @@ class BindingEditor:
         self._commit_project_fields()
         self._commit_group_fields()
         self._commit_choice_fields()
-        group = BindingGroup(group_name="新分组", number=1.0, choices=[])
-        self.projects[self.selected_project_index].required_groups.append(group)
+        groups = self.projects[self.selected_project_index].required_groups
+        groups.append(BindingGroup(group_name="新分组", number=1.0, choices=[]))
         self._refresh_group_list()
-        new_index = len(self.projects[self.selected_project_index].required_groups) - 1
+        new_index = len(groups) - 1
         self.group_list.selection_set(new_index)
         self._ensure_group_visible(new_index)
         self.group_list.event_generate("<<ListboxSelect>>")
@@ -3475,9 +3679,9 @@ class BindingEditor:
         if not selection:
             return
         index = selection[0]
-        del self.projects[self.selected_project_index].required_groups[index]
-        self._refresh_group_list()
         groups = self.projects[self.selected_project_index].required_groups
+        del groups[index]
+        self._refresh_group_list()
         if groups:
             new_index = min(index, len(groups) - 1)
             self.group_list.selection_set(new_index)
@@ -3491,7 +3695,7 @@ class BindingEditor:
         self._commit_choice_fields()
         self._commit_group_fields()
         group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
-        self.group_clipboard = BindingGroup.from_dict(group.to_dict())
+        self.group_clipboard = group.clone()
 
     def _paste_group(self) -> None:
         if self.selected_project_index is None:
@@ -3503,7 +3707,7 @@ class BindingEditor:
         self._commit_group_fields()
         self._commit_choice_fields()
         target_project = self.projects[self.selected_project_index]
-        new_group = BindingGroup.from_dict(self.group_clipboard.to_dict())
+        new_group = self.group_clipboard.clone()
         target_project.required_groups.append(new_group)
         self._refresh_group_list()
         new_index = len(target_project.required_groups) - 1
@@ -3522,6 +3726,7 @@ class BindingEditor:
         group.choices.append(BindingChoice(part_no="", desc=""))
         self._refresh_choice_list()
         new_index = len(group.choices) - 1
+        self._ensure_choice_row(new_index)
         self.choice_tree.selection_set(str(new_index))
         self._on_choice_select()
 
@@ -3529,15 +3734,14 @@ class BindingEditor:
         if self.selected_choice_index is None:
             return
         current_index = self.selected_choice_index
+        # 提交时已原地更新该行，无需重建整个表格
         self._commit_choice_fields()
-        self._refresh_choice_list()
-        group = self.projects[self.selected_project_index].required_groups[self.selected_group_index]
-        if group.choices:
-            target_index = min(current_index, len(group.choices) - 1)
-            self.choice_tree.selection_set(str(target_index))
+        item_id = str(current_index)
+        if self.choice_tree.exists(item_id):
+            self.choice_tree.selection_set(item_id)
+            self.choice_tree.see(item_id)
+            # 回填规范化后的字段（去空白、数量解析结果等），使表单与模型一致
             self._on_choice_select()
-        else:
-            self._clear_choice_fields()
 
     def _remove_choice(self) -> None:
         if (
@@ -3553,6 +3757,7 @@ class BindingEditor:
         self._refresh_choice_list()
         if group.choices:
             new_index = min(removed_index, len(group.choices) - 1)
+            self._ensure_choice_row(new_index)
             self.choice_tree.selection_set(str(new_index))
             self._on_choice_select()
 
@@ -3561,21 +3766,84 @@ class BindingEditor:
         self._commit_group_fields()
         self._commit_project_fields()
 
+    def _io_busy(self) -> bool:
+        if self._io_thread and self._io_thread.is_alive():
+            messagebox.showinfo("提示", "正在处理文件，请稍候。", **self._dialog_kwargs)
+            return True
+        return False
+
+    def _run_in_background(
+        self,
+        button: Button,
+        action: str,
+        task: Callable[[], Any],
+        on_success: Callable[[Any], None] | None = None,
+    ) -> None:
+        idle_text = button.cget("text")
+
+        def _finish(result: Any, error: Exception | None) -> None:
+            self._io_thread = None
+            try:
+                button.config(state="normal", text=idle_text)
+            except Exception:
+                return
+            if error:
+                messagebox.showerror("错误", f"{action}失败：{error}", **self._dialog_kwargs)
+                return
+            if on_success:
+                on_success(result)
+            messagebox.showinfo("完成", f"{action}成功", **self._dialog_kwargs)
+
+        def _worker() -> None:
+            result: Any = None
+            error: Exception | None = None
+            try:
+                result = task()
+            except Exception as exc:  # noqa: BLE001 - background feedback
+                error = exc
+            try:
+                self.top.after(0, lambda: _finish(result, error))
+            except Exception:
+                pass
+
+        button.config(state="disabled", text=f"正在{action}…")
+        thread = threading.Thread(target=_worker, daemon=True)
+        self._io_thread = thread
+        thread.start()
+
+    def _snapshot_projects(self) -> list[BindingProject]:
+        # 后台线程只操作副本，界面可继续编辑而不影响写出的内容
+        return [project.clone() for project in self.projects]
+
     def _import_excel(self) -> None:
+        if self._io_busy():
+            return
         file_path = filedialog.askopenfilename(
             filetypes=[("Excel", "*.xlsx"), ("Excel", "*.xlsm")], parent=self.top
         )
         if not file_path:
             return
-        try:
-            self.binding_library.import_excel(Path(file_path))
-        except Exception as exc:
-            messagebox.showerror("错误", f"导入失败：{exc}", **self._dialog_kwargs)
-            return
-        self._load_data()
-        messagebox.showinfo("完成", "导入成功", **self._dialog_kwargs)
+        _BINDING_CACHE.pop(self.binding_library.path, None)
+        self._run_in_background(
+            self.import_button,
+            "导入",
+            lambda: self._read_and_save_excel(Path(file_path)),
+            self._apply_imported_projects,
+        )
+
+    def _read_and_save_excel(self, excel_path: Path) -> list[BindingProject]:
+        # 后台线程只解析并写盘，不触碰界面仍在读取的共享项目列表
+        projects = self.binding_library.read_excel(excel_path)
+        self.binding_library.save(projects)
+        return projects
+
+    def _apply_imported_projects(self, projects: list[BindingProject]) -> None:
+        self.binding_library.projects = projects
+        self._show_library_projects()
 
     def _export_excel(self) -> None:
+        if self._io_busy():
+            return
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
             filetypes=[("Excel", "*.xlsx")],
@@ -3584,28 +3852,29 @@ class BindingEditor:
         if not file_path:
             return
         self._commit_all()
-        original_projects = self.binding_library.projects
-        self.binding_library.projects = self.projects
-        try:
-            self.binding_library.export_excel(Path(file_path))
-        except Exception as exc:
-            messagebox.showerror("错误", f"导出失败：{exc}", **self._dialog_kwargs)
-            return
-        finally:
-            self.binding_library.projects = original_projects
-        messagebox.showinfo("完成", "导出成功", **self._dialog_kwargs)
+        snapshot = self._snapshot_projects()
+        self._run_in_background(
+            self.export_button,
+            "导出",
+            lambda: self.binding_library.export_excel(Path(file_path), snapshot),
+        )
 
     def _save(self) -> None:
-        self._commit_all()
-        self.binding_library.projects = self.projects
-        try:
-            self.binding_library.save()
-        except Exception as exc:
-            messagebox.showerror("错误", f"保存失败：{exc}", **self._dialog_kwargs)
+        if self._io_busy():
             return
-        messagebox.showinfo("完成", "保存成功", **self._dialog_kwargs)
+        self._commit_all()
+        snapshot = self._snapshot_projects()
+        _BINDING_CACHE.pop(self.binding_library.path, None)
+        # 共享库持有已保存内容的副本，不引用编辑器仍在修改的列表
+        self.binding_library.projects = list(snapshot)
+        self._run_in_background(
+            self.save_button, "保存", lambda: self.binding_library.save(snapshot)
+        )
 
     def _handle_close(self) -> None:
+        # 后台线程为守护线程，写盘途中关闭窗口可能随程序退出被中断
+        if self._io_busy():
+            return
         if self.on_close:
             try:
                 self.on_close()
@@ -4550,21 +4819,31 @@ class ImportantMaterialEditor:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             if not self.path.exists():
                 self.path.touch()
-            content = self.path.read_text(encoding="utf-8")
+            content = self.path.read_bytes().decode("utf-8")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
         except Exception as exc:  # pragma: no cover - user feedback
             messagebox.showerror(
                 "加载失败", f"读取重要物料失败：{exc}", **self._dialog_kwargs
             )
             content = ""
-        self.text.delete(1.0, END)
-        self.text.insert(END, content)
+        self.text.replace("1.0", END, content)
 
     def _save_content(self) -> None:
-        content = self.text.get("1.0", END)
-        if content.endswith("\n"):
-            content = content[:-1]
+        content = self.text.get("1.0", "end-1c")
+        if self.path.suffix.lower() == ".json" and content.strip():
+            try:
+                content = _format_json_text(content)
+            except json.JSONDecodeError as exc:
+                messagebox.showerror(
+                    "保存失败", f"重要物料 JSON 格式错误，未写入文件：{exc}", **self._dialog_kwargs
+                )
+                return
+            self.text.replace("1.0", END, content)
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
         try:
-            self.path.write_text(content, encoding="utf-8")
+            self.path.write_bytes(content.encode("utf-8"))
         except Exception as exc:  # pragma: no cover - user feedback
             messagebox.showerror(
                 "保存失败", f"写入重要物料失败：{exc}", **self._dialog_kwargs
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import csv
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+import hashlib
 import json
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional
@@ -13,6 +18,18 @@ from urllib.parse import urlparse
 import requests
 from bs4 import BeautifulSoup
 from openpyxl import load_workbook
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional dependency
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover
+    lxml = None  # type: ignore[assignment]
 
 from .excel_processor import normalize_part_no
 from .part_assets import PartAsset, PartAssetStore
@@ -23,6 +40,41 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36"
 )
 
+_SEARCH_CACHE_SIZE = 4096
+# 抓取过程中每处理若干料号或间隔若干秒才写一次进度，结束时再补写一次
+_PROGRESS_SAVE_EVERY = 20
+_PROGRESS_SAVE_INTERVAL = 2.0
+# 追加日志中的记录数超过任务数的倍数后整体重写一次
+_PROGRESS_COMPACT_RATIO = 2
+
+_BRAND_PATTERNS = tuple(
+    re.compile(rf"{label}\s*[:：]?\s*([^,;；，/\s]+)")
+    for label in ("品牌", "牌子", "厂家", "厂商")
+)
+_MODEL_PATTERNS = tuple(
+    re.compile(rf"{label}\s*[:：]?\s*([^,;；，/\s]+)")
+    for label in ("型号", "规格型号", "机型")
+)
+_DESCRIPTION_SPLIT_PATTERN = re.compile(r"[\s,;，；/、]+")
+_HTTP_LINK_PATTERN = re.compile(r"https?://[^\s]+")
+_UA_SOURCE_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xls", ".csv", ".txt"})
+# lxml 解析搜索结果页比内置 html.parser 快数倍，未安装时退回内置解析器
+_HTML_PARSER = "lxml" if lxml is not None else "html.parser"
+
+
+def _build_session(pool_size: int = 32) -> requests.Session:
+    # 复用连接，避免每次搜索/下载都重新进行 TCP+TLS 握手
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
 
 @dataclass
 class CrawlStatus:
@@ -54,42 +106,192 @@ class AssetCrawler:
         delay_seconds: float = 1.0,
         description_lookup: Optional[Callable[[str], str]] = None,
         ua_lookup_dir: Optional[Path] = None,
+        max_workers: int = 1,
     ) -> None:
-        self.store = PartAssetStore(asset_root)
-        self.progress_path = progress_path or (asset_root / "crawl_progress.json")
+        self._session = _build_session(max(32, max_workers))
+        self.store = PartAssetStore(asset_root, session=self._session)
+        # 进度以 JSONL 追加记录，每行一个任务状态，同一料号以最后一行为准
+        self.progress_path = progress_path or (asset_root / "crawl_progress.jsonl")
+        self._legacy_progress_path = (
+            None if progress_path else asset_root / "crawl_progress.json"
+        )
         self.delay_seconds = delay_seconds
+        self.max_workers = max(1, max_workers)
         self._description_lookup = description_lookup
         self._ua_lookup_dir = ua_lookup_dir if ua_lookup_dir and ua_lookup_dir.exists() else None
         self._ua_sources: list[Path] = []
         self._ua_index: dict[str, list[str]] = {}
         self._ua_rows: list[tuple[str, list[str]]] = []
+        self._ua_cache_path = asset_root / "ua_index.json"
+        self._ua_sources_cache_path = asset_root / "ua_sources.cache.json"
+        self._ua_row_hits: dict[str, list[str]] = {}
         self._tasks: Dict[str, CrawlStatus] = {}
+        self._progress_lock = threading.Lock()
+        self._progress_records = 0
+        self._unsaved_records: list[Dict] = []
+        self._last_progress_save = time.monotonic()
+        # 记录搜索结果页的 ETag/Last-Modified，便于条件请求命中 304 时直接复用
+        self._bing_cache_path = asset_root / "bing_cache.json"
+        self._bing_cache: OrderedDict[str, dict] = self._load_bing_cache()
+        self._bing_cache_dirty = False
+        # 相同关键字的官网搜索结果在内存中按 LRU 复用，找到的链接落盘供下次启动使用
+        self._search_cache_path = asset_root / "search_cache.json"
+        self._search_cache: OrderedDict[str, Optional[str]] = self._load_search_cache()
+        self._search_cache_dirty = False
+        self._description_cache: dict[str, str] = {}
+        # 多个料号常对应同一品牌+型号关键字，并发时同一关键字只发起一次搜索，其余等待结果
+        self._search_inflight: dict[str, threading.Event] = {}
+        self._cache_lock = threading.Lock()
         if self._ua_lookup_dir:
             self._ua_sources = self._collect_ua_sources(self._ua_lookup_dir)
             self._ua_index, self._ua_rows = self._build_ua_index(self._ua_sources)
         self._load_progress()
 
     def _load_progress(self) -> None:
-        if not self.progress_path.exists():
-            return
+        path = self.progress_path
+        if not path.exists():
+            if self._legacy_progress_path is None or not self._legacy_progress_path.exists():
+                return
+            path = self._legacy_progress_path
         try:
-            raw = json.loads(self.progress_path.read_text(encoding="utf-8"))
-            for item in raw:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return
+        if text.lstrip().startswith("["):
+            # 旧版进度文件为整体 JSON 数组
+            try:
+                raw = json.loads(text)
+                for item in raw:
+                    status = CrawlStatus.from_dict(item)
+                    if status.part_no:
+                        self._tasks[status.part_no] = status
+            except json.JSONDecodeError:
+                # 如果进度文件损坏，则忽略并重新开始
+                self._tasks = {}
+            # 立即转写为追加格式，之后只需追加变更记录
+            self._save_progress()
+            return
+
+        damaged = False
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                # 中途终止可能留下不完整的行，跳过后在下面整体重写
+                damaged = True
+                continue
+            self._progress_records += 1
+            if not isinstance(item, dict) or not item.get("part_no"):
+                continue
+            if item.get("removed"):
+                self._tasks.pop(item["part_no"], None)
+            else:
                 status = CrawlStatus.from_dict(item)
-                if status.part_no:
-                    self._tasks[status.part_no] = status
-        except json.JSONDecodeError:
-            # 如果进度文件损坏，则忽略并重新开始
-            self._tasks = {}
+                self._tasks[status.part_no] = status
+        if damaged:
+            self._save_progress()
 
     def _save_progress(self) -> None:
-        payload = [task.to_dict() for task in self._tasks.values()]
-        self.progress_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        # 整体重写（压缩）进度文件
+        with self._progress_lock:
+            lines = [
+                json.dumps(task.to_dict(), ensure_ascii=False) + "\n"
+                for task in self._tasks.values()
+            ]
+            # 先写临时文件再替换，中途终止也不会留下损坏的进度文件
+            temp_path = self.progress_path.with_name(self.progress_path.name + ".tmp")
+            temp_path.write_text("".join(lines), encoding="utf-8")
+            os.replace(temp_path, self.progress_path)
+            self._progress_records = len(lines)
+            self._unsaved_records = []
+            self._last_progress_save = time.monotonic()
+        self._save_search_caches()
+
+    def _append_progress(self, records: list[Dict]) -> None:
+        if not records:
+            return
+        with self._progress_lock:
+            with self.progress_path.open("a", encoding="utf-8") as handle:
+                handle.write(
+                    "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+                )
+            self._progress_records += len(records)
+            needs_compact = self._progress_records > _PROGRESS_COMPACT_RATIO * max(
+                len(self._tasks), 1
+            )
+        if needs_compact:
+            self._save_progress()
+
+    def _mark_progress(self, status: CrawlStatus) -> None:
+        with self._progress_lock:
+            self._unsaved_records.append(status.to_dict())
+            due = (
+                len(self._unsaved_records) >= _PROGRESS_SAVE_EVERY
+                or time.monotonic() - self._last_progress_save > _PROGRESS_SAVE_INTERVAL
+            )
+        if due:
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        with self._progress_lock:
+            records = self._unsaved_records
+            self._unsaved_records = []
+            self._last_progress_save = time.monotonic()
+        self._append_progress(records)
+        self._save_search_caches()
+
+    def _load_bing_cache(self) -> OrderedDict[str, dict]:
+        cache: OrderedDict[str, dict] = OrderedDict()
+        if not self._bing_cache_path.exists():
+            return cache
+        try:
+            raw = json.loads(self._bing_cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return cache
+        if isinstance(raw, dict):
+            # 与搜索结果缓存同样只保留最近使用的条目，文件按使用先后顺序保存
+            for key, value in list(raw.items())[-_SEARCH_CACHE_SIZE:]:
+                if isinstance(value, dict):
+                    cache[key] = value
+        return cache
+
+    def _load_search_cache(self) -> OrderedDict[str, Optional[str]]:
+        cache: OrderedDict[str, Optional[str]] = OrderedDict()
+        if not self._search_cache_path.exists():
+            return cache
+        try:
+            raw = json.loads(self._search_cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return cache
+        if isinstance(raw, dict):
+            for key, value in list(raw.items())[-_SEARCH_CACHE_SIZE:]:
+                if isinstance(value, str) and value:
+                    cache[key] = value
+        return cache
+
+    def _save_bing_cache(self) -> None:
+        # 条件请求缓存只在一次运行结束时整体写出，避免每次刷新进度都重写整个文件
+        with self._cache_lock:
+            if not self._bing_cache_dirty:
+                return
+            payload = json.dumps(self._bing_cache, ensure_ascii=False)
+            self._bing_cache_dirty = False
+        self._bing_cache_path.write_text(payload, encoding="utf-8")
+
+    def _save_search_caches(self) -> None:
+        with self._cache_lock:
+            if self._search_cache_dirty:
+                # 未找到的结果只在本次运行内复用，下次启动仍会重新搜索
+                payload = {key: value for key, value in self._search_cache.items() if value}
+                self._search_cache_path.write_text(
+                    json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+                )
+                self._search_cache_dirty = False
 
     def add_tasks(self, part_numbers: Iterable[str]) -> None:
-        changed = False
+        changed: dict[str, Dict] = {}
         for part in part_numbers:
             normalized = normalize_part_no(part)
             if not normalized:
@@ -99,22 +301,21 @@ class AssetCrawler:
                 if existing.status == "done":
                     existing.status = "pending"
                     existing.message = ""
-                    changed = True
+                    changed[normalized] = existing.to_dict()
                 continue
-            self._tasks[normalized] = CrawlStatus(part_no=normalized)
-            changed = True
-        if changed:
-            self._save_progress()
+            status = CrawlStatus(part_no=normalized)
+            self._tasks[normalized] = status
+            changed[normalized] = status.to_dict()
+        self._append_progress(list(changed.values()))
 
     def remove_tasks(self, part_numbers: Iterable[str]) -> None:
-        removed = False
+        removed: list[Dict] = []
         for part in part_numbers:
             normalized = normalize_part_no(part)
             if normalized and normalized in self._tasks:
                 del self._tasks[normalized]
-                removed = True
-        if removed:
-            self._save_progress()
+                removed.append({"part_no": normalized, "removed": True})
+        self._append_progress(removed)
 
     def clear(self) -> None:
         if not self._tasks:
@@ -126,29 +327,57 @@ class AssetCrawler:
         return [p for p, task in self._tasks.items() if task.status != "done"]
 
     def run(self, limit: Optional[int] = None, should_cancel=None) -> bool:
-        processed = 0
+        return asyncio.run(self.run_async(limit, should_cancel))
+
+    async def run_async(
+        self,
+        limit: Optional[int] = None,
+        should_cancel=None,
+        concurrency: Optional[int] = None,
+    ) -> bool:
+        # 抓取几乎全是网络等待，多个料号并发处理；每个并发槽处理完仍按 delay_seconds 间隔
+        pending = self.pending()
+        if limit is not None:
+            pending = pending[: max(limit, 0)]
+        self._prefetch_ua_row_hits(pending)
+        concurrency = max(1, concurrency or self.max_workers)
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
         cancelled = False
-        for part_no in list(self.pending()):
-            if should_cancel and should_cancel():
-                cancelled = True
-                break
-            if limit is not None and processed >= limit:
-                break
-            status = self._tasks[part_no]
+
+        async def worker(part_no: str) -> None:
+            nonlocal cancelled
+            async with semaphore:
+                if cancelled or (should_cancel and should_cancel()):
+                    cancelled = True
+                    return
+                await loop.run_in_executor(executor, self._run_part, part_no)
+                if self.delay_seconds:
+                    await asyncio.sleep(self.delay_seconds)
+
+        # 使用独立线程池，线程数与并发槽一致，不占用事件循环的默认线程池
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="asset-crawler"
+        ) as executor:
             try:
-                message = self._process_part(part_no)
-                status.status = "done"
-                status.message = message
-            except Exception as exc:  # noqa: BLE001
-                status.status = "failed"
-                status.message = str(exc)
-            self._tasks[part_no] = status
-            self._save_progress()
-            processed += 1
-            if self.delay_seconds:
-                time.sleep(self.delay_seconds)
+                await asyncio.gather(*(worker(part_no) for part_no in pending))
+            finally:
+                if self._unsaved_records:
+                    self._flush_progress()
+                self._save_bing_cache()
         return cancelled
 
+    def _run_part(self, part_no: str) -> None:
+        status = self._tasks[part_no]
+        try:
+            message = self._process_part(part_no)
+            status.status = "done"
+            status.message = message
+        except Exception as exc:  # noqa: BLE001
+            status.status = "failed"
+            status.message = str(exc)
+        self._mark_progress(status)
+
     def statuses(self) -> List[CrawlStatus]:
         return sorted(self._tasks.values(), key=lambda item: item.part_no)
 
@@ -196,12 +425,11 @@ class AssetCrawler:
 
         elif should_overwrite_uc:
             for keyword in search_terms:
-                image_path = self.store.download_first_image_from_search(part_no, keyword)
+                # 直接以新图片替换原有图片，下载后只保存一次资源索引
+                image_path = self.store.download_first_image_from_search(
+                    part_no, keyword, replace=True
+                )
                 if image_path:
-                    asset = self.store.get(part_no)
-                    if asset:
-                        asset.images = [image_path]
-                        self.store.upsert(asset)
                     updates.append("图片")
                     break
 
@@ -214,20 +442,92 @@ class AssetCrawler:
     def _lookup_description(self, part_no: str) -> str:
         if not self._description_lookup:
             return ""
+        cached = self._description_cache.get(part_no)
+        if cached is not None:
+            return cached
         try:
-            return self._description_lookup(part_no) or ""
+            description = self._description_lookup(part_no) or ""
         except Exception:
             return ""
+        self._description_cache[part_no] = description
+        return description
 
     def _search_official_site(self, keyword: str) -> Optional[str]:
-        response = requests.get(
+        cache_key = " ".join(keyword.split()).lower()
+        while True:
+            with self._cache_lock:
+                if cache_key in self._search_cache:
+                    self._search_cache.move_to_end(cache_key)
+                    return self._search_cache[cache_key]
+                inflight = self._search_inflight.get(cache_key)
+                if inflight is None:
+                    inflight = threading.Event()
+                    self._search_inflight[cache_key] = inflight
+                    break
+            # 等待正在进行的同关键字搜索；若其失败未写入缓存，则由本线程重新搜索
+            inflight.wait()
+        try:
+            official = self._fetch_official_site(keyword)
+            with self._cache_lock:
+                self._search_cache[cache_key] = official
+                self._search_cache.move_to_end(cache_key)
+                while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+                if official:
+                    self._search_cache_dirty = True
+        finally:
+            with self._cache_lock:
+                self._search_inflight.pop(cache_key, None)
+            inflight.set()
+        return official
+
+    def _fetch_official_site(self, keyword: str) -> Optional[str]:
+        cache_key = hashlib.sha1(keyword.encode("utf-8")).hexdigest()
+        with self._cache_lock:
+            cached = self._bing_cache.get(cache_key)
+            if cached is not None:
+                self._bing_cache.move_to_end(cache_key)
+        headers: dict[str, str] = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        response = self._session.get(
             "https://www.bing.com/search",
             params={"q": f"{keyword} 官网", "setlang": "zh-cn"},
-            headers={"User-Agent": USER_AGENT},
+            headers=headers or None,
             timeout=15,
         )
+        if response.status_code == 304 and cached is not None:
+            return cached.get("official")
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        official = self._parse_official_link(
+            response.content, keyword, encoding=response.encoding
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._cache_lock:
+                self._bing_cache[cache_key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "official": official,
+                }
+                self._bing_cache.move_to_end(cache_key)
+                while len(self._bing_cache) > _SEARCH_CACHE_SIZE:
+                    self._bing_cache.popitem(last=False)
+                self._bing_cache_dirty = True
+        return official
+
+    def _parse_official_link(
+        self, html: bytes | str, keyword: str, encoding: Optional[str] = None
+    ) -> Optional[str]:
+        # 直接解析原始字节，省去 requests 先整体解码成 str 的一步
+        if isinstance(html, bytes):
+            soup = BeautifulSoup(html, _HTML_PARSER, from_encoding=encoding)
+        else:
+            soup = BeautifulSoup(html, _HTML_PARSER)
         normalized = (normalize_part_no(keyword) or keyword).lower()
         fallback: Optional[str] = None
         for link in soup.select("li.b_algo h2 a, ol#b_results h2 a"):
@@ -244,6 +544,29 @@ class AssetCrawler:
         parsed = urlparse(url)
         return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
+    def _prefetch_ua_row_hits(self, part_numbers: Iterable[str]) -> None:
+        # 索引未直接命中的 UA 料号需要在档案行文本中做子串查找；
+        # 安装了 pyahocorasick 时用一个自动机一次扫描所有行，替代每个料号各扫一遍
+        self._ua_row_hits = {}
+        if ahocorasick is None or not self._ua_rows:
+            return
+        targets: dict[str, str] = {}
+        for part_no in part_numbers:
+            normalized = normalize_part_no(part_no) or part_no
+            if normalized.startswith("UA") and not self._ua_index.get(normalized):
+                targets[normalized.lower()] = normalized
+        if not targets:
+            return
+        automaton = ahocorasick.Automaton()
+        for lower_part in targets:
+            automaton.add_word(lower_part, lower_part)
+        automaton.make_automaton()
+        hits: dict[str, list[str]] = {lower_part: [] for lower_part in targets}
+        for row_text, paths in self._ua_rows:
+            for lower_part in {value for _, value in automaton.iter(row_text)}:
+                hits[lower_part].extend(paths)
+        self._ua_row_hits = {targets[lower_part]: found for lower_part, found in hits.items()}
+
     def _update_from_ua_sources(self, part_no: str) -> list[str]:
         if not self._ua_sources:
             return []
@@ -254,10 +577,14 @@ class AssetCrawler:
         if direct_hits:
             found_local.extend(direct_hits)
         if not found_local:
-            lower_part = normalized.lower()
-            for row_text, paths in self._ua_rows:
-                if lower_part in row_text:
-                    found_local.extend(paths)
+            prefetched = self._ua_row_hits.get(normalized)
+            if prefetched is not None:
+                found_local.extend(prefetched)
+            else:
+                lower_part = normalized.lower()
+                for row_text, paths in self._ua_rows:
+                    if lower_part in row_text:
+                        found_local.extend(paths)
 
         updates: list[str] = []
         found_local = list(dict.fromkeys(found_local))
@@ -265,11 +592,10 @@ class AssetCrawler:
         if found_local:
             asset = self.store.get(part_no) or PartAsset(part_no=part_no)
             existing_local = set(asset.local_paths)
-            merged_local = list(existing_local)
-            for path in found_local:
-                if path not in existing_local:
-                    merged_local.append(path)
-            if merged_local != list(existing_local):
+            new_local = [path for path in found_local if path not in existing_local]
+            if new_local:
+                merged_local = list(dict.fromkeys(asset.local_paths))
+                merged_local.extend(new_local)
                 self.store.set_local_paths(part_no, merged_local)
                 updates.append("UA档案")
 
@@ -279,7 +605,7 @@ class AssetCrawler:
         local: list[str] = []
         normalized = normalize_part_no(part_no) or part_no
         try:
-            workbook = load_workbook(path, data_only=True, read_only=True)
+            workbook = load_workbook(path, data_only=True, read_only=True, keep_links=False)
         except Exception:
             return local
 
@@ -314,29 +640,78 @@ class AssetCrawler:
     def _build_ua_index(
         self, sources: list[Path]
     ) -> tuple[dict[str, list[str]], list[tuple[str, list[str]]]]:
+        # 每个档案文件的扫描结果按 (mtime, size) 缓存，只有变更过的文件才重新读取
+        cached = self._load_ua_cache()
+        entries: dict[str, dict] = {}
+        changed = False
+        for path in sources:
+            key = str(path)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(key)
+            if not isinstance(entry, dict) or entry.get("signature") != signature:
+                entry = {"signature": signature, **self._scan_ua_source(path)}
+                changed = True
+            entries[key] = entry
+        if changed or entries.keys() != cached.keys():
+            self._save_ua_cache(entries)
+
         index: dict[str, set[str]] = defaultdict(set)
         rows: list[tuple[str, list[str]]] = []
-        for path in sources:
-            suffix = path.suffix.lower()
-            if suffix in {".xlsx", ".xlsm", ".xls"}:
-                rows.extend(self._collect_rows_from_excel(path, index))
-            elif suffix in {".csv", ".txt"}:
-                rows.extend(self._collect_rows_from_csv(path, index))
+        for entry in entries.values():
+            for key, values in entry["index"].items():
+                index[key].update(values)
+            rows.extend((row_text, paths) for row_text, paths in entry["rows"])
         finalized_index = {key: sorted(values) for key, values in index.items()}
         return finalized_index, rows
 
+    def _scan_ua_source(self, path: Path) -> dict:
+        index: dict[str, set[str]] = defaultdict(set)
+        rows: list[tuple[str, list[str]]] = []
+        suffix = path.suffix.lower()
+        if suffix in {".xlsx", ".xlsm", ".xls"}:
+            rows = self._collect_rows_from_excel(path, index)
+        elif suffix in {".csv", ".txt"}:
+            rows = self._collect_rows_from_csv(path, index)
+        return {
+            "index": {key: sorted(values) for key, values in index.items()},
+            "rows": [[row_text, paths] for row_text, paths in rows],
+        }
+
+    def _load_ua_cache(self) -> dict[str, dict]:
+        if not self._ua_cache_path.exists():
+            return {}
+        try:
+            raw = json.loads(self._ua_cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return raw if isinstance(raw, dict) else {}
+
+    def _save_ua_cache(self, entries: dict[str, dict]) -> None:
+        try:
+            self._ua_cache_path.write_text(
+                json.dumps(entries, ensure_ascii=False), encoding="utf-8"
+            )
+        except OSError:
+            pass
+
     def _collect_rows_from_excel(
         self, path: Path, index: dict[str, set[str]]
     ) -> list[tuple[str, list[str]]]:
         rows: list[tuple[str, list[str]]] = []
         try:
-            workbook = load_workbook(path, data_only=True, read_only=True)
+            workbook = load_workbook(path, data_only=True, read_only=True, keep_links=False)
         except Exception:
             return rows
 
         try:
             for sheet in workbook.worksheets:
                 for row in sheet.iter_rows(values_only=True):
+                    if not _row_has_path_separator(row):
+                        continue
                     cached = self._process_ua_row(row, index)
                     if cached:
                         rows.append(cached)
@@ -352,6 +727,8 @@ class AssetCrawler:
             with path.open("r", encoding="utf-8", errors="ignore") as handle:
                 reader = csv.reader(handle)
                 for row in reader:
+                    if not _row_has_path_separator(row):
+                        continue
                     cached = self._process_ua_row(row, index)
                     if cached:
                         rows.append(cached)
@@ -371,25 +748,82 @@ class AssetCrawler:
         for value in values:
             if value is None:
                 continue
-            normalized_value = normalize_part_no(str(value))
+            normalized_value = _normalize_cell_text(value if type(value) is str else str(value))
             if normalized_value:
                 index[normalized_value].update(local_paths)
         return combined_text.lower(), local_paths
 
     def _collect_ua_sources(self, root: Path) -> list[Path]:
+        cached = self._load_ua_sources_cache(root)
+        if cached is not None:
+            return cached
         sources: list[Path] = []
-        supported = {".xlsx", ".xlsm", ".xls", ".csv", ".txt"}
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix.lower() not in supported:
-                continue
-            if path.name.startswith("~$"):
+        directories: dict[str, int] = {}
+        pending = [str(root)]
+        while pending:
+            current = pending.pop()
+            try:
+                # 先记录目录修改时间再列举，列举期间的变更会在下次校验时被发现
+                directories[current] = os.stat(current).st_mtime_ns
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        name = entry.name
+                        if name.startswith("~$"):
+                            continue
+                        if os.path.splitext(name)[1].lower() not in _UA_SOURCE_SUFFIXES:
+                            continue
+                        sources.append(Path(entry.path))
+            except OSError:
                 continue
-            sources.append(path)
         sources.sort()
+        self._save_ua_sources_cache(root, directories, sources)
         return sources
 
+    def _load_ua_sources_cache(self, root: Path) -> list[Path] | None:
+        # 目录中增删文件或子目录都会改变该目录的修改时间，所有目录均未变化时可直接沿用上次的文件列表
+        if not self._ua_sources_cache_path.exists():
+            return None
+        try:
+            raw = json.loads(self._ua_sources_cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(raw, dict) or raw.get("root") != str(root):
+            return None
+        directories = raw.get("directories")
+        files = raw.get("files")
+        if not isinstance(directories, dict) or not isinstance(files, list):
+            return None
+        for directory, mtime_ns in directories.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+        return [Path(item) for item in files]
+
+    def _save_ua_sources_cache(
+        self, root: Path, directories: dict[str, int], sources: list[Path]
+    ) -> None:
+        payload = {
+            "root": str(root),
+            "directories": directories,
+            "files": [str(path) for path in sources],
+        }
+        try:
+            self._ua_sources_cache_path.write_text(
+                json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+            )
+        except OSError:
+            pass
+
     def _cell_contains_part(self, value, normalized_part: str) -> bool:
         if value is None:
             return False
@@ -401,38 +835,59 @@ class AssetCrawler:
 
     def _extract_local_paths_from_row(self, values: Iterable) -> list[str]:
         paths: list[str] = []
+        seen: set[str] = set()
         for value in values:
             if value is None:
                 continue
             text = str(value).strip()
-            if not text or self._is_http_url(text):
+            if not text or ("\\" not in text and "/" not in text):
+                continue
+            if self._is_http_url(text):
                 continue
-            if "\\" in text or "/" in text:
-                cleaned = text
-                if cleaned.startswith("\\") and not cleaned.startswith("\\\\"):
-                    cleaned = "\\" + cleaned
-                cleaned = cleaned.strip()
-                if cleaned and cleaned not in paths:
-                    paths.append(cleaned)
+            cleaned = text
+            if cleaned.startswith("\\") and not cleaned.startswith("\\\\"):
+                cleaned = "\\" + cleaned
+            cleaned = cleaned.strip()
+            if cleaned and cleaned not in seen:
+                seen.add(cleaned)
+                paths.append(cleaned)
         return paths
 
     def _extract_http_links(self, values: Iterable) -> list[str]:
         links: list[str] = []
+        seen: set[str] = set()
         for value in values:
             if value is None:
                 continue
-            for match in re.findall(r"https?://[^\s]+", str(value)):
+            for match in _HTTP_LINK_PATTERN.findall(str(value)):
                 cleaned = match.strip().rstrip(",.;)\"]")
-                if cleaned and cleaned not in links:
+                if cleaned and cleaned not in seen:
+                    seen.add(cleaned)
                     links.append(cleaned)
         return links
 
 
+def _normalize_cell_text(text: str) -> str:
+    # 与 normalize_part_no 结果相同，但不经过料号缓存，避免档案中的描述、路径等单元格挤占缓存
+    return "".join(text.upper().split())
+
+
+def _row_has_path_separator(row: Iterable) -> bool:
+    # 只有含路径分隔符的行才可能提取出本地路径，其余行无需逐格规范化和建立索引
+    for value in row:
+        if value is None:
+            continue
+        text = value if type(value) is str else str(value)
+        if "/" in text or "\\" in text:
+            return True
+    return False
+
+
 def _extract_brand_model(description: str) -> tuple[str | None, str | None]:
-    brand = _extract_labeled_value(description, ("品牌", "牌子", "厂家", "厂商"))
-    model = _extract_labeled_value(description, ("型号", "规格型号", "机型"))
+    brand = _extract_labeled_value(description, _BRAND_PATTERNS)
+    model = _extract_labeled_value(description, _MODEL_PATTERNS)
 
-    tokens = [token for token in re.split(r"[\s,;，；/、]+", description or "") if token]
+    tokens = [token for token in _DESCRIPTION_SPLIT_PATTERN.split(description or "") if token]
     if not brand and tokens:
         brand = tokens[0]
     if not model and len(tokens) > 1:
@@ -441,9 +896,12 @@ def _extract_brand_model(description: str) -> tuple[str | None, str | None]:
     return brand, model
 
 
-def _extract_labeled_value(description: str, labels: tuple[str, ...]) -> str | None:
-    for label in labels:
-        match = re.search(rf"{label}\s*[:：]?\s*([^,;；，/\s]+)", description or "")
+def _extract_labeled_value(
+    description: str, patterns: tuple[re.Pattern[str], ...]
+) -> str | None:
+    text = description or ""
+    for pattern in patterns:
+        match = pattern.search(text)
         if match:
             value = match.group(1).strip()
             if value:
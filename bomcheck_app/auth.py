@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import hmac
+import secrets
+from json import JSONDecodeError
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set
 
+from .json_utils import json_dumps, json_loads
+
 
 PERMISSION_LABELS: Dict[str, str] = {
     "invalid_part": "编辑失效料号库",
@@ -16,10 +21,52 @@ PERMISSION_LABELS: Dict[str, str] = {
 }
 
 
-def _hash_password(raw: str) -> str:
+_PBKDF2_PREFIX = "pbkdf2$sha256$"
+_PBKDF2_ITERATIONS = 200_000
+
+
+def _hash_password(
+    raw: str, salt: bytes | None = None, iterations: int = _PBKDF2_ITERATIONS
+) -> str:
+    # 加盐并多轮迭代，存储格式：pbkdf2$sha256$<迭代次数>$<盐>$<摘要>
+    if salt is None:
+        salt = secrets.token_bytes(16)
+    derived = hashlib.pbkdf2_hmac("sha256", raw.encode("utf-8"), salt, iterations)
+    return f"{_PBKDF2_PREFIX}{iterations}${salt.hex()}${derived.hex()}"
+
+
+def _legacy_hash_password(raw: str) -> str:
+    # 旧版账户文件使用的单轮无盐 SHA-256
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
+def _hashes_equal(left: str, right: str) -> bool:
+    # 定长比较，避免按首个不同字符提前返回而泄露匹配长度
+    return hmac.compare_digest(left.encode("utf-8"), right.encode("utf-8"))
+
+
+def _verify_password(stored: str, raw: str) -> bool:
+    if not stored.startswith(_PBKDF2_PREFIX):
+        return _hashes_equal(stored, _legacy_hash_password(raw))
+    try:
+        iterations_text, salt_hex, digest_hex = stored[len(_PBKDF2_PREFIX):].split("$")
+        iterations = int(iterations_text)
+        salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(digest_hex)
+    except ValueError:
+        return False
+    if iterations <= 0:
+        return False
+    derived = hashlib.pbkdf2_hmac("sha256", raw.encode("utf-8"), salt, iterations)
+    return hmac.compare_digest(derived, expected)
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    # 用户不存在时用于陪跑校验，使其耗时与真实用户一致；首次需要时才计算
+    return _hash_password("")
+
+
 @dataclass
 class UserAccount:
     username: str
@@ -57,7 +104,11 @@ class UserAccount:
         self.password_hash = _hash_password(password)
 
     def verify(self, password: str) -> bool:
-        return self.password_hash == _hash_password(password)
+        return _verify_password(self.password_hash, password)
+
+    @property
+    def needs_rehash(self) -> bool:
+        return not self.password_hash.startswith(_PBKDF2_PREFIX)
 
     def can(self, permission: str) -> bool:
         return self.is_admin or permission in self.permissions
@@ -75,8 +126,8 @@ class AccountStore:
             self._ensure_default_admin()
             return
         try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            raw = json_loads(self.path.read_bytes())
+        except JSONDecodeError:
             self.accounts = {}
             self._ensure_default_admin()
             return
@@ -96,13 +147,24 @@ class AccountStore:
     def save(self) -> None:
         payload: List[Dict] = [user.to_dict() for user in self.accounts.values()]
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self.path.write_bytes(json_dumps(payload))
 
     def authenticate(self, username: str, password: str) -> UserAccount | None:
         account = self.accounts.get(username)
-        if account and account.verify(password):
-            return account
-        return None
+        if account is None:
+            # 不存在的用户名同样计算并比较一次哈希，避免通过响应时间判断用户名是否存在
+            _verify_password(_dummy_password_hash(), password)
+            return None
+        if not account.verify(password):
+            return None
+        if account.needs_rehash:
+            # 旧版哈希在登录成功时升级为 PBKDF2；账户文件不可写时下次登录再试
+            account.set_password(password)
+            try:
+                self.save()
+            except OSError:
+                pass
+        return account
 
     def upsert(self, account: UserAccount) -> None:
         if not account.username:
@@ -1,14 +1,34 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from sys import intern
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from openpyxl import Workbook, load_workbook
 
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
 
-@dataclass
+try:  # pragma: no cover - optional dependency
+    from pyexcelerate import Workbook as FastWorkbook
+except ImportError:  # pragma: no cover
+    FastWorkbook = None  # type: ignore[assignment]
+
+from .json_utils import json_dumps, json_loads
+
+_STREAM_THRESHOLD = 4 * 1024 * 1024
+_FAST_EXPORT_THRESHOLD = 50_000
+
+
+_EXCEL_HEADERS = ("项目描述", "索引料号", "索引描述", "分组名称", "分组数量", "料号", "描述", "条件模式", "条件料号", "数量")
+
+
+@dataclass(slots=True)
 class BindingChoice:
     part_no: str
     desc: str
@@ -16,13 +36,18 @@ class BindingChoice:
     condition_part_nos: List[str] = field(default_factory=list)
     number: Optional[float] = None
 
+    @property
+    def joined_conditions(self) -> str:
+        # 每次按当前列表拼接，字段被整体替换或原地修改后都不会读到旧值
+        return ",".join(self.condition_part_nos)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BindingChoice":
         return cls(
-            part_no=data.get("partNo", ""),
+            part_no=_intern(data.get("partNo", "")),
             desc=data.get("desc", ""),
-            condition_mode=data.get("conditionMode"),
-            condition_part_nos=list(data.get("conditionPartNos", []) or []),
+            condition_mode=_intern(data.get("conditionMode")),
+            condition_part_nos=[_intern(item) for item in data.get("conditionPartNos", []) or []],
             number=_parse_number(data.get("number")),
         )
 
@@ -39,8 +64,17 @@ class BindingChoice:
             data["number"] = self.number
         return data
 
+    def clone(self) -> "BindingChoice":
+        return BindingChoice(
+            part_no=self.part_no,
+            desc=self.desc,
+            condition_mode=self.condition_mode,
+            condition_part_nos=list(self.condition_part_nos),
+            number=self.number,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class BindingGroup:
     group_name: str
     number: float = 1.0
@@ -49,7 +83,7 @@ class BindingGroup:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BindingGroup":
         return cls(
-            group_name=data.get("groupName", ""),
+            group_name=_intern(data.get("groupName", "")),
             number=_parse_number(data.get("number", 1)) or 1.0,
             choices=[BindingChoice.from_dict(item) for item in data.get("choices", [])],
         )
@@ -62,8 +96,15 @@ class BindingGroup:
         }
         return data
 
+    def clone(self) -> "BindingGroup":
+        return BindingGroup(
+            group_name=self.group_name,
+            number=self.number,
+            choices=[choice.clone() for choice in self.choices],
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class BindingProject:
     project_desc: str
     index_part_no: str
@@ -73,8 +114,8 @@ class BindingProject:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BindingProject":
         return cls(
-            project_desc=data.get("projectDesc", ""),
-            index_part_no=data.get("indexPartNo", ""),
+            project_desc=_intern(data.get("projectDesc", "")),
+            index_part_no=_intern(data.get("indexPartNo", "")),
             index_part_desc=data.get("indexPartDesc", ""),
             required_groups=[BindingGroup.from_dict(group) for group in data.get("requiredGroups", [])],
         )
@@ -87,6 +128,17 @@ class BindingProject:
             "requiredGroups": [group.to_dict() for group in self.required_groups],
         }
 
+    def clone(self) -> "BindingProject":
+        return BindingProject(
+            project_desc=self.project_desc,
+            index_part_no=self.index_part_no,
+            index_part_desc=self.index_part_desc,
+            required_groups=[group.clone() for group in self.required_groups],
+        )
+
+
+_PLACEHOLDER_CHOICES = (BindingChoice(part_no="", desc=""),)
+
 
 class BindingLibrary:
     def __init__(self, path: Path):
@@ -98,111 +150,167 @@ class BindingLibrary:
             self.projects = []
             return
 
-        raw_text = self.path.read_text(encoding="utf-8").strip()
-        if not raw_text:
+        if ijson is not None and self.path.stat().st_size > _STREAM_THRESHOLD:
+            projects = self._load_streaming()
+            if projects is not None:
+                self.projects = projects
+                return
+
+        raw_bytes = self.path.read_bytes()
+        first = _first_content_byte(raw_bytes)
+        if not first:
             self.projects = []
             return
 
-        data = self._load_payload(raw_text)
+        data = self._load_payload(raw_bytes, first)
         if isinstance(data, dict):
             data = [data]
 
         self.projects = [BindingProject.from_dict(item) for item in data]
 
-    def _load_payload(self, raw_text: str) -> Any:
+    def _load_streaming(self) -> Optional[List[BindingProject]]:
+        # 大文件逐个项目解析，避免同时持有原始文本和完整的解析树
+        with self.path.open("rb") as handle:
+            first = handle.read(1)
+            while first and first.isspace():
+                first = handle.read(1)
+            if first != b"[":
+                return None
+            handle.seek(-1, 1)
+            return [
+                BindingProject.from_dict(item)
+                for item in ijson.items(handle, "item", use_float=True)
+            ]
+
+    def _load_payload(self, raw_bytes: bytes, first: bytes) -> Any:
+        # 解析器本身会忽略首尾空白，只有旧格式（逗号分隔的多个对象）才需要补方括号
         try:
-            return json.loads(raw_text)
+            return json_loads(raw_bytes)
         except json.JSONDecodeError:
-            trimmed = raw_text.strip()
-            if trimmed.startswith("{") and trimmed.endswith("}"):
+            if first == b"{":
                 try:
-                    return json.loads(f"[{trimmed}]")
+                    return json_loads(b"[" + raw_bytes + b"]")
                 except json.JSONDecodeError:
                     pass
             raise
 
-    def save(self) -> None:
-        payload = [project.to_dict() for project in self.projects]
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    def save(self, projects: Optional[Sequence[BindingProject]] = None) -> None:
+        if projects is None:
+            projects = self.projects
+        payload = [project.to_dict() for project in projects]
+        # 先写临时文件再替换，保存期间读取或中途退出都不会遇到半截文件
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            temp_path.write_bytes(json_dumps(payload))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-    def export_excel(self, excel_path: Path) -> None:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "绑定料号"
-        ws.append(["项目描述", "索引料号", "索引描述", "分组名称", "分组数量", "料号", "描述", "条件模式", "条件料号", "数量"])
-        for project in self.projects:
-            for group in project.required_groups:
-                for choice in group.choices or [BindingChoice(part_no="", desc="")]:
-                    ws.append([
-                        project.project_desc,
-                        project.index_part_no,
-                        project.index_part_desc,
-                        group.group_name,
-                        group.number,
-                        choice.part_no,
-                        choice.desc,
-                        choice.condition_mode or "",
-                        ",".join(choice.condition_part_nos),
-                        choice.number if choice.number is not None else "",
-                    ])
+    def export_excel(self, excel_path: Path, projects: Optional[Sequence[BindingProject]] = None) -> None:
+        if projects is None:
+            projects = self.projects
+        if FastWorkbook is not None and _export_row_count(projects) > _FAST_EXPORT_THRESHOLD:
+            # 超大导出交给 pyexcelerate 一次性整表写入
+            fast_wb = FastWorkbook()
+            fast_wb.new_sheet("绑定料号", data=[_EXCEL_HEADERS, *_export_rows(projects)])
+            fast_wb.save(str(excel_path))
+            return
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("绑定料号")
+        ws.append(_EXCEL_HEADERS)
+        # 按项目逐批生成行并写出，内存中最多只保留一个项目的行
+        for project in projects:
+            for row in _export_rows((project,)):
+                ws.append(row)
         wb.save(excel_path)
 
     def import_excel(self, excel_path: Path) -> None:
-        wb = load_workbook(excel_path)
-        ws = wb.active
-        header = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1, values_only=False))]
-        columns = {name: idx for idx, name in enumerate(header)}
+        self.projects = self.read_excel(excel_path)
+        self.save()
 
-        def cell(row_data, key: str, fallback: int | None = None):
-            idx = columns.get(key)
-            if idx is None:
-                idx = fallback
-            if idx is None:
-                return None
-            if idx >= len(row_data):
-                return None
-            return row_data[idx]
-
-        projects_map: Dict[str, BindingProject] = {}
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            row = list(row)
-            project_desc = str(cell(row, "项目描述", 0) or "").strip()
-            index_part_no = str(cell(row, "索引料号", 1) or "").strip()
-            key = f"{project_desc}::{index_part_no}"
-            project = projects_map.setdefault(
-                key,
-                BindingProject(
+    def read_excel(self, excel_path: Path) -> List[BindingProject]:
+        # 只顺序读取单元格值，使用只读流式模式，无需构建带样式的单元格模型
+        wb = load_workbook(excel_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            return self._read_excel_projects(wb.active)
+        finally:
+            wb.close()
+
+    def _read_excel_projects(self, ws) -> List[BindingProject]:
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        columns = {name: idx for idx, name in enumerate(header)}
+        positions = [
+            columns[name] if columns.get(name) is not None else fallback
+            for fallback, name in enumerate(_EXCEL_HEADERS)
+        ]
+        (
+            desc_idx,
+            index_idx,
+            index_desc_idx,
+            group_idx,
+            group_number_idx,
+            part_idx,
+            part_desc_idx,
+            mode_idx,
+            condition_idx,
+            number_idx,
+        ) = positions
+
+        # 同一单元格文本在各行大量重复，每个不同的取值只清洗一次
+        normalized: Dict[str, str] = {}
+
+        def text(value: Any) -> str:
+            if type(value) is not str:
+                return intern(str(value or "").strip())
+            result = normalized.get(value)
+            if result is None:
+                result = normalized[value] = intern(value.strip())
+            return result
+
+        projects_map: Dict[Tuple[str, str], BindingProject] = {}
+        group_index: Dict[Tuple[str, str, str], BindingGroup] = {}
+        # 指定 max_col 后每行都是等长元组，可直接按位置取值
+        for row in ws.iter_rows(min_row=2, max_col=max(positions) + 1, values_only=True):
+            project_desc = text(row[desc_idx])
+            index_part_no = text(row[index_idx])
+            key = (project_desc, index_part_no)
+            project = projects_map.get(key)
+            if project is None:
+                project = projects_map[key] = BindingProject(
                     project_desc=project_desc,
                     index_part_no=index_part_no,
-                    index_part_desc=str(cell(row, "索引描述", 2) or "").strip(),
-                ),
-            )
-            group_name = str(cell(row, "分组名称", 3) or "").strip()
+                    index_part_desc=text(row[index_desc_idx]),
+                )
+            group_name = text(row[group_idx])
             if not group_name:
                 continue
-            group_number_value = cell(row, "分组数量", 4) or 1
-            try:
-                group_number = float(group_number_value)
-            except (TypeError, ValueError):
-                group_number = 1.0
-            group = _get_or_create_group(project.required_groups, group_name, group_number)
-            part_no = str(cell(row, "料号", 5) or "").strip()
-            desc = str(cell(row, "描述", 6) or "").strip()
-            condition_mode = str(cell(row, "条件模式", 7) or "").strip() or None
-            condition_part_nos_raw = cell(row, "条件料号", 8) or ""
-            condition_part_nos = [item.strip() for item in str(condition_part_nos_raw).split(",") if item.strip()]
-            number_value = cell(row, "数量", 9)
-            choice = BindingChoice(
-                part_no=part_no,
-                desc=desc,
-                condition_mode=condition_mode,
-                condition_part_nos=condition_part_nos,
-                number=_parse_number(number_value),
+            group_key = (project_desc, index_part_no, group_name)
+            group = group_index.get(group_key)
+            if group is None:
+                group_number = _parse_number(row[group_number_idx] or 1)
+                if group_number is None:
+                    group_number = 1.0
+                group = group_index[group_key] = BindingGroup(group_name=group_name, number=group_number)
+                project.required_groups.append(group)
+            part_no = text(row[part_idx])
+            if not part_no:
+                continue
+            condition_part_nos_raw = row[condition_idx] or ""
+            group.choices.append(
+                BindingChoice(
+                    part_no=part_no,
+                    desc=text(row[part_desc_idx]),
+                    condition_mode=text(row[mode_idx]) or None,
+                    condition_part_nos=[
+                        intern(item.strip())
+                        for item in str(condition_part_nos_raw).split(",")
+                        if item.strip()
+                    ],
+                    number=_parse_number(row[number_idx]),
+                )
             )
-            if part_no:
-                group.choices.append(choice)
-        self.projects = list(projects_map.values())
-        self.save()
+        return list(projects_map.values())
 
     def find_project(self, part_no: str) -> Optional[BindingProject]:
         for project in self.projects:
@@ -222,19 +330,61 @@ class BindingLibrary:
         return iter(self.projects)
 
 
+def _export_row_count(projects: Sequence[BindingProject]) -> int:
+    return sum(len(group.choices) or 1 for project in projects for group in project.required_groups)
+
+
+def _export_rows(projects: Sequence[BindingProject]) -> List[tuple]:
+    # 先统计总行数一次性分配列表，项目和分组字段在外层循环取出
+    rows: List[Any] = [None] * _export_row_count(projects)
+    index = 0
+    for project in projects:
+        project_desc = project.project_desc
+        index_part_no = project.index_part_no
+        index_part_desc = project.index_part_desc
+        for group in project.required_groups:
+            group_name = group.group_name
+            group_number = group.number
+            for choice in group.choices or _PLACEHOLDER_CHOICES:
+                rows[index] = (
+                    project_desc,
+                    index_part_no,
+                    index_part_desc,
+                    group_name,
+                    group_number,
+                    choice.part_no,
+                    choice.desc,
+                    choice.condition_mode or "",
+                    choice.joined_conditions,
+                    choice.number if choice.number is not None else "",
+                )
+                index += 1
+    return rows
+
+
+def _first_content_byte(raw_bytes: bytes) -> bytes:
+    for offset, byte in enumerate(raw_bytes):
+        if byte not in b" \t\r\n":
+            return raw_bytes[offset : offset + 1]
+    return b""
+
+
+def _intern(value: Any) -> Any:
+    # 料号、分组名在库中大量重复，驻留后共享同一字符串对象
+    return intern(value) if type(value) is str else value
+
+
 def _parse_number(value: Any) -> Optional[float]:
-    if value is None or value == "":
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value == "":
         return None
     try:
         return float(value)
     except (TypeError, ValueError):
         return None
-
-
-def _get_or_create_group(groups: List[BindingGroup], name: str, number: float) -> BindingGroup:
-    for group in groups:
-        if group.group_name == name:
-            return group
-    group = BindingGroup(group_name=name, number=number)
-    groups.append(group)
-    return group
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import re
 from json import JSONDecodeError
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+from .json_utils import json_dumps, json_loads
 
 
 DEFAULT_CONFIG = {
@@ -82,39 +83,59 @@ class AppConfig:
         }
 
 
+_INVALID_BACKSLASH_PATTERN = re.compile(r"(?<!\\)\\(?![\\/\"bfnrtu])")
+_LINE_COMMENT_PATTERN = re.compile(r"(?m)^\s*//.*$")
+_BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_TRAILING_COMMA_PATTERN = re.compile(r",(\s*[}\]])")
+
+# 配置路径 -> ((mtime_ns, size), 解析结果)；文件未变化时直接复用，无需重新读取解析
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], AppConfig]] = {}
+
+
 def load_config(path: Path) -> AppConfig:
     base_dir = path.parent
     if not path.exists():
         save_config(path, AppConfig.from_dict(DEFAULT_CONFIG, base_dir))
 
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        # 返回副本，调用方修改字段不会影响缓存
+        return replace(cached[1])
+
     raw_text = path.read_text(encoding="utf-8")
     sanitized_text = _sanitize_json_text(raw_text)
     corrected = sanitized_text != raw_text
+    fallback = False
 
     try:
-        data = json.loads(sanitized_text)
+        data = json_loads(sanitized_text)
     except JSONDecodeError:
         # If we still cannot load the configuration, fall back to defaults and
         # preserve the original text for manual inspection.
         backup_path = path.with_suffix(path.suffix + ".bak")
         backup_path.write_text(raw_text, encoding="utf-8")
         data = DEFAULT_CONFIG
-        corrected = True
+        fallback = True
 
     config = AppConfig.from_dict(data, base_dir)
-    if corrected:
+    # 仅格式被修正（BOM、换行、注释、尾逗号等）而内容与将要写回的一致时无需重写文件
+    if fallback or (corrected and data != config.to_dict(base_dir)):
         save_config(path, config)
+    else:
+        _CONFIG_CACHE[path] = (signature, replace(config))
     return config
 
 
 def save_config(path: Path, config: AppConfig) -> None:
     base_dir = path.parent
-    path.write_text(json.dumps(config.to_dict(base_dir), ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(json_dumps(config.to_dict(base_dir)))
+    _CONFIG_CACHE.pop(path, None)
 
 
 def _escape_invalid_backslashes(raw_text: str) -> str:
-    pattern = r"(?<!\\)\\(?![\\/\"bfnrtu])"
-    return re.sub(pattern, r"\\\\", raw_text)
+    return _INVALID_BACKSLASH_PATTERN.sub(r"\\\\", raw_text)
 
 
 def _sanitize_json_text(raw_text: str) -> str:
@@ -151,9 +172,9 @@ def _to_relative(path: Path, base_dir: Path) -> str:
 def _strip_json_comments(text: str) -> str:
     # Remove // line comments that start a line and /* block comments */ while
     # leaving inline URLs untouched.
-    text = re.sub(r"(?m)^\s*//.*$", "", text)
-    return re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    text = _LINE_COMMENT_PATTERN.sub("", text)
+    return _BLOCK_COMMENT_PATTERN.sub("", text)
 
 
 def _remove_trailing_commas(text: str) -> str:
-    return re.sub(r",(\s*[}\]])", r"\1", text)
+    return _TRAILING_COMMA_PATTERN.sub(r"\1", text)
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 import re
+import sys
 from math import isclose
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
@@ -22,7 +25,7 @@ from .models import (
     ReplacementSummary,
     RequirementGroupResult,
 )
-from .text_utils import normalize_text, normalized_variants
+from .text_utils import normalize_text, normalized_variants, normalized_variants_batch
 
 
 class SaveWorkbookError(Exception):
@@ -36,9 +39,17 @@ class SaveWorkbookError(Exception):
 
 
 def normalize_part_no(value: str) -> str:
+    if type(value) is str:
+        return _normalize_part_text(value)
     return "".join(str(value).strip().upper().split())
 
 
+@lru_cache(maxsize=65536)
+def _normalize_part_text(value: str) -> str:
+    # 同一料号在 BOM、失效库和绑定库之间反复出现，缓存规范化结果
+    return "".join(value.strip().upper().split())
+
+
 BLACK_FILL = PatternFill(start_color="000000", end_color="000000", fill_type="solid")
 INFERRED_LEVEL_FILL = PatternFill(
     start_color="FFFFE699", end_color="FFFFE699", fill_type="solid"
@@ -149,6 +160,7 @@ def format_quantity_text(value) -> str:
     return text
 
 
+_QUANTITY_NUMBER_PATTERN = re.compile(r"[-+]?\d+(?:\.\d+)?")
 _PART_NO_PATTERN = re.compile(r"^[A-Z0-9][A-Z0-9._/-]*$")
 
 
@@ -165,6 +177,47 @@ def _is_probable_part_number(value: str) -> bool:
     return True
 
 
+_InvalidEntry = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def _load_invalid_entries(path: Path) -> Dict[str, _InvalidEntry]:
+    stat = path.stat()
+    return _read_invalid_entries(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_invalid_entries(
+    path: Path, mtime_ns: int, size: int
+) -> Dict[str, _InvalidEntry]:
+    # 按修改时间和大小缓存，失效库未变化时重复执行无需重新解析；
+    # 只读取前四列的值，使用只读模式流式解析
+    invalid_wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    invalid_entries: Dict[str, _InvalidEntry] = {}
+    try:
+        invalid_ws = invalid_wb.active
+        for row in invalid_ws.iter_rows(min_row=2, max_col=4, values_only=True):
+            invalid_no = str(row[0]).strip() if row[0] else ""
+            invalid_desc = str(row[1]).strip() if row[1] else ""
+            replacement_no = str(row[2]).strip() if row[2] else None
+            replacement_desc = str(row[3]).strip() if row[3] else None
+            if invalid_no:
+                invalid_entries[normalize_part_no(invalid_no)] = (
+                    invalid_no,
+                    invalid_desc,
+                    replacement_no,
+                    replacement_desc,
+                )
+    finally:
+        invalid_wb.close()
+    return invalid_entries
+
+
+def _sort_by_quantity_desc(rows: List[Tuple[str, str, float]]) -> None:
+    # 等价于按 (-数量, 料号) 排序：先按料号排，再利用稳定排序按数量倒序
+    rows.sort(key=itemgetter(0))
+    rows.sort(key=itemgetter(2), reverse=True)
+
+
 _STANDARD_BOM_HEADER = [
     "level",
     "item",
@@ -180,8 +233,12 @@ _STANDARD_BOM_HEADER = [
 class ExcelProcessor:
     def __init__(self, config) -> None:
         self.config = config
+        # id(choice) -> (条件模式, 规范化后的条件料号集合)，每次执行前清空
+        self._condition_cache: Dict[int, Tuple[str, frozenset[str]]] = {}
 
     def execute(self, excel_path: Path, binding_library: BindingLibrary) -> ExecutionResult:
+        _normalize_part_text.cache_clear()
+        self._condition_cache.clear()
         wb = load_workbook(excel_path)
 
         result_sheet_names = {"执行统计", "剩余物料", "重要物料"}
@@ -197,7 +254,11 @@ class ExcelProcessor:
 
         debug_logs: List[str] = []
 
-        replacement_summary, replacement_debug = self._apply_replacements(data_sheets)
+        # 失效替换阶段未改动的工作表，其值快照可直接交给数量统计阶段复用
+        sheet_snapshots: Dict[str, List[Tuple]] = {}
+        replacement_summary, replacement_debug = self._apply_replacements(
+            data_sheets, sheet_snapshots
+        )
         debug_logs.extend(replacement_debug)
 
         (
@@ -205,7 +266,7 @@ class ExcelProcessor:
             part_desc,
             part_display,
             quantity_debug,
-        ) = self._extract_part_quantities(data_sheets)
+        ) = self._extract_part_quantities(data_sheets, sheet_snapshots)
         debug_logs.extend(quantity_debug)
 
         # Apply replacements to aggregated data
@@ -221,7 +282,7 @@ class ExcelProcessor:
 
             if qty:
                 part_quantities[replacement_key] += qty
-            part_display.setdefault(replacement_key, record.replacement_part_no)
+            part_display.setdefault(replacement_key, sys.intern(record.replacement_part_no))
             if record.replacement_desc:
                 part_desc.setdefault(replacement_key, record.replacement_desc)
 
@@ -269,7 +330,7 @@ class ExcelProcessor:
                 )
             )
 
-        important_rows.sort(key=lambda item: (-item[2], item[0]))
+        _sort_by_quantity_desc(important_rows)
 
         remainder_rows = []
         for part_no, qty in available_inventory.items():
@@ -287,7 +348,7 @@ class ExcelProcessor:
                 )
             )
 
-        remainder_rows.sort(key=lambda item: (-item[2], item[0]))
+        _sort_by_quantity_desc(remainder_rows)
 
         self._write_result_sheets(
             wb,
@@ -315,34 +376,25 @@ class ExcelProcessor:
 
         return execution_result
 
-    def _apply_replacements(self, worksheets: List[Worksheet]) -> Tuple[ReplacementSummary, List[str]]:
+    def _apply_replacements(
+        self,
+        worksheets: List[Worksheet],
+        sheet_snapshots: Dict[str, List[Tuple]],
+    ) -> Tuple[ReplacementSummary, List[str]]:
         summary = ReplacementSummary()
         debug_logs: List[str] = []
 
-        invalid_wb = load_workbook(self.config.invalid_part_db)
-        invalid_ws = invalid_wb.active
-
-        invalid_entries: Dict[str, Tuple[str, str, Optional[str], Optional[str]]] = {}
-        for row in invalid_ws.iter_rows(min_row=2, values_only=True):
-            invalid_no = str(row[0]).strip() if row[0] else ""
-            invalid_desc = str(row[1]).strip() if row[1] else ""
-            replacement_no = str(row[2]).strip() if row[2] else None
-            replacement_desc = str(row[3]).strip() if row[3] else None
-            if invalid_no:
-                invalid_entries[normalize_part_no(invalid_no)] = (
-                    invalid_no,
-                    invalid_desc,
-                    replacement_no,
-                    replacement_desc,
-                )
+        invalid_entries = _load_invalid_entries(self.config.invalid_part_db)
 
         for ws in worksheets:  # 遍历目标工作表，高亮并记录命中的失效料号
-            part_col_idx = self._identify_part_column(ws)
+            rows = self._snapshot_values(ws)
+            sheet_snapshots[ws.title] = rows
+            part_col_idx = self._identify_part_column(rows)
             debug_logs.append(f"[{ws.title}] 识别料号列: {self._format_column_debug(part_col_idx)}")
             if part_col_idx is None:
                 continue
 
-            header_rows = self._find_standard_header_rows(ws)
+            header_rows = self._find_standard_header_rows(rows)
             is_standard_bom = self._is_standard_bom(header_rows)
             start_row = header_rows[-1] + 1 if is_standard_bom else 2
 
@@ -351,7 +403,9 @@ class ExcelProcessor:
             replacement_col = replacement_start_col + 1
             replacement_desc_col = replacement_start_col + 2
 
-            for row_idx, row in enumerate(ws.iter_rows(min_row=start_row), start=start_row):
+            for row_idx, row in enumerate(
+                ws.iter_rows(min_row=start_row, max_row=len(rows)), start=start_row
+            ):
                 if part_col_idx >= len(row):
                     continue
                 cell_value = row[part_col_idx].value
@@ -385,16 +439,18 @@ class ExcelProcessor:
                     )
                     continue
 
+                # 即将写入替换信息，原快照不再反映工作表内容
+                sheet_snapshots.pop(ws.title, None)
                 for cell in row:
                     cell.fill = BLACK_FILL
 
                 if replacement_no:
-                    ws.cell(row=row_idx, column=status_col).value = "已失效，已替换"
-                    ws.cell(row=row_idx, column=replacement_col).value = replacement_no
-                    ws.cell(row=row_idx, column=replacement_desc_col).value = replacement_desc
+                    ws.cell(row=row_idx, column=status_col, value="已失效，已替换")
+                    ws.cell(row=row_idx, column=replacement_col, value=replacement_no)
+                    ws.cell(row=row_idx, column=replacement_desc_col, value=replacement_desc)
                     summary.total_replaced += 1
                 else:
-                    ws.cell(row=row_idx, column=status_col).value = "已失效，无替代料"
+                    ws.cell(row=row_idx, column=status_col, value="已失效，无替代料")
 
                 summary.records.append(record)
 
@@ -475,6 +531,7 @@ class ExcelProcessor:
     def _extract_part_quantities(
         self,
         worksheets: List[Worksheet],
+        sheet_snapshots: Dict[str, List[Tuple]],
     ) -> Tuple[Dict[str, float], Dict[str, str], Dict[str, str], List[str]]:
         part_quantities: Dict[str, float] = defaultdict(float)
         part_descriptions: Dict[str, str] = {}
@@ -487,9 +544,13 @@ class ExcelProcessor:
             if ws.title in skip_titles:
                 debug_logs.append(f"[{ws.title}] 已跳过汇总工作表")
                 continue
-            qty_col_idx = self._identify_quantity_column(ws)
-            part_col_idx = self._identify_part_column(ws)
-            desc_col_idx = self._identify_description_column(ws, part_col_idx)
+            # 失效替换阶段改动过的工作表（追加了列）需要重新取快照
+            rows = sheet_snapshots.get(ws.title)
+            if rows is None:
+                rows = self._snapshot_values(ws)
+            qty_col_idx = self._identify_quantity_column(rows)
+            part_col_idx = self._identify_part_column(rows)
+            desc_col_idx = self._identify_description_column(rows, part_col_idx)
             debug_logs.append(
                 f"[{ws.title}] 数量列: {self._format_column_debug(qty_col_idx)}, 料号列: {self._format_column_debug(part_col_idx)}, 描述列: {self._format_column_debug(desc_col_idx)}"
             )
@@ -497,7 +558,7 @@ class ExcelProcessor:
             if part_col_idx is None:
                 continue
 
-            header_rows = self._find_standard_header_rows(ws)
+            header_rows = self._find_standard_header_rows(rows)
             is_standard_bom = self._is_standard_bom(header_rows)
             start_row = header_rows[-1] + 1 if is_standard_bom else 2
             if header_rows:
@@ -515,7 +576,9 @@ class ExcelProcessor:
             previous_level: Optional[int] = None
             previous_prefix: Optional[str] = None
 
-            for row_idx, row in enumerate(ws.iter_rows(min_row=start_row), start=start_row):
+            for row_idx, row in enumerate(
+                ws.iter_rows(min_row=start_row, max_row=len(rows)), start=start_row
+            ):
                 if part_col_idx >= len(row):
                     continue
 
@@ -524,25 +587,26 @@ class ExcelProcessor:
                     continue
 
                 normalized_part, display_no, override_desc = resolved
-                part_display.setdefault(normalized_part, display_no)
-
-
-                normalized_part, display_no, override_desc = resolved
-                part_display.setdefault(normalized_part, display_no)
-
-                desc_value: Optional[str] = override_desc
-                if not desc_value:
-                    desc_cell = (
-                        row[part_col_idx + 1]
-                        if desc_col_idx is None and part_col_idx + 1 < len(row)
-                        else None
-                    )
-                    if desc_col_idx is not None and desc_col_idx < len(row):
-                        desc_cell = row[desc_col_idx]
-                    if desc_cell and desc_cell.value:
-                        desc_value = str(desc_cell.value).strip()
-                if desc_value:
-                    part_descriptions.setdefault(normalized_part, desc_value)
+                if normalized_part not in part_display:
+                    # 首次出现时驻留料号键和显示值，后续统计与分配阶段的字典查找可直接比较对象
+                    normalized_part = sys.intern(normalized_part)
+                    part_display[normalized_part] = sys.intern(display_no)
+
+                # 描述只保留首次出现的值，已有描述的料号无需再读取描述单元格
+                if normalized_part not in part_descriptions:
+                    desc_value: Optional[str] = override_desc
+                    if not desc_value:
+                        desc_cell = (
+                            row[part_col_idx + 1]
+                            if desc_col_idx is None and part_col_idx + 1 < len(row)
+                            else None
+                        )
+                        if desc_col_idx is not None and desc_col_idx < len(row):
+                            desc_cell = row[desc_col_idx]
+                        if desc_cell and desc_cell.value:
+                            desc_value = str(desc_cell.value).strip()
+                    if desc_value:
+                        part_descriptions[normalized_part] = desc_value
 
                 quantity = 1.0
                 level_value: Optional[int] = None
@@ -613,7 +677,18 @@ class ExcelProcessor:
 
         return part_quantities, part_descriptions, part_display, debug_logs
 
-    def _identify_quantity_column(self, ws: Worksheet) -> Optional[int]:
+    def _snapshot_values(self, ws: Worksheet) -> List[Tuple]:
+        """一次性读取工作表的全部单元格值，供各列识别逻辑直接按下标访问。
+
+        末尾的空行（常见于只带格式、没有数据的区域）会被去掉，
+        因此 ``len(rows)`` 即最后一个有数据的行号，可作为逐行处理的上界。
+        """
+        rows = list(ws.iter_rows(values_only=True))
+        while rows and all(value is None or value == "" for value in rows[-1]):
+            rows.pop()
+        return rows
+
+    def _identify_quantity_column(self, rows: List[Tuple]) -> Optional[int]:
         """Guess the quantity column by combining header keywords and numeric shape.
 
         The previous implementation required every non-empty cell to be parsable as a
@@ -623,7 +698,7 @@ class ExcelProcessor:
         columns are ignored (常见为序号/料号)，并根据可解析为整数的单元格数量作为首要排序规则。
         """
 
-        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        header_row = rows[0] if rows else None
         header_candidates: List[int] = []
         if header_row:
             for idx, value in enumerate(header_row):
@@ -637,42 +712,45 @@ class ExcelProcessor:
                 if any(keyword in lowered for keyword in ("数量", "數量", "qty", "quantity")):
                     header_candidates.append(idx)
 
-        # (col_idx, integer_count, numeric_count, failure_count, total_count)
-        numeric_scores: List[Tuple[int, int, int, int, int]] = []
-        for col_idx in range(ws.max_column):
-            if col_idx < 2:
-                continue
-            numeric_count = 0
-            integer_count = 0
-            failure_count = 0
-            total_count = 0
-            for cell in ws.iter_rows(
-                min_row=2,
-                min_col=col_idx + 1,
-                max_col=col_idx + 1,
-                values_only=True,
-            ):
-                value = cell[0]
+        # 按行一次遍历，同时累计各列的整数/失败/非空计数
+        max_col = len(rows[0]) if rows else 0
+        integer_counts = [0] * max_col
+        failure_counts = [0] * max_col
+        total_counts = [0] * max_col
+        parse_quantity = self._parse_quantity_value
+        for row in rows[1:]:
+            for col_idx in range(2, max_col):
+                value = row[col_idx]
                 if value in (None, ""):
                     continue
-                total_count += 1
-                parsed = self._parse_quantity_value(value)
-                if parsed is None:
-                    failure_count += 1
+                total_counts[col_idx] += 1
+                if type(value) is int:
+                    # Excel 中最常见的整数数量无需再走通用解析
+                    if value > 0:
+                        integer_counts[col_idx] += 1
+                    else:
+                        failure_counts[col_idx] += 1
                     continue
-
-                is_positive_integer = parsed > 0 and isclose(
+                parsed = parse_quantity(value)
+                if parsed is not None and parsed > 0 and isclose(
                     parsed, round(parsed), abs_tol=1e-6
-                )
-                if is_positive_integer:
-                    numeric_count += 1
-                    integer_count += 1
+                ):
+                    integer_counts[col_idx] += 1
                 else:
-                    failure_count += 1
-            if numeric_count:
-                numeric_scores.append(
-                    (col_idx, integer_count, numeric_count, failure_count, total_count)
-                )
+                    failure_counts[col_idx] += 1
+
+        # (col_idx, integer_count, numeric_count, failure_count, total_count)
+        numeric_scores: List[Tuple[int, int, int, int, int]] = [
+            (
+                col_idx,
+                integer_counts[col_idx],
+                integer_counts[col_idx],
+                failure_counts[col_idx],
+                total_counts[col_idx],
+            )
+            for col_idx in range(2, max_col)
+            if integer_counts[col_idx]
+        ]
 
         def _select_best(
             scores: List[Tuple[int, int, int, int, int]]
@@ -695,6 +773,12 @@ class ExcelProcessor:
         return _select_best(numeric_scores)
 
     def _parse_quantity_value(self, value) -> Optional[float]:
+        # 先按精确类型处理 Excel 最常见的 int/float，避免 isinstance 与文本解析
+        value_type = type(value)
+        if value_type is int:
+            return float(value)
+        if value_type is float:
+            return value if value == value else None  # NaN check
         if value in (None, ""):
             return None
         if isinstance(value, bool):
@@ -707,11 +791,12 @@ class ExcelProcessor:
             if not (number == number):  # NaN check
                 return None
             return number
-        text = str(value).strip()
+        text = value.strip() if value_type is str else str(value).strip()
         if not text:
             return None
-        normalized = text.replace(",", "")
-        match = re.search(r"[-+]?\d+(?:\.\d+)?", normalized)
+        if "," in text:
+            text = text.replace(",", "")
+        match = _QUANTITY_NUMBER_PATTERN.search(text)
         if not match:
             return None
         try:
@@ -736,15 +821,15 @@ class ExcelProcessor:
                 return False
         return True
 
-    def _find_standard_header_rows(self, ws: Worksheet) -> List[int]:
+    def _find_standard_header_rows(self, rows: List[Tuple]) -> List[int]:
         header_rows: List[int] = []
-        for idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+        for idx, row in enumerate(rows, start=1):
             if self._row_matches_standard_header(row):
                 header_rows.append(idx)
         return header_rows
 
     def _detect_data_start_row(self, ws: Worksheet) -> int:
-        header_rows = self._find_standard_header_rows(ws)
+        header_rows = self._find_standard_header_rows(self._snapshot_values(ws))
         if self._is_standard_bom(header_rows):
             return header_rows[-1] + 1
         return 2
@@ -836,37 +921,34 @@ class ExcelProcessor:
 
         return cumulative_qty
 
-    def _identify_part_column(self, ws: Worksheet) -> Optional[int]:
+    def _identify_part_column(self, rows: List[Tuple]) -> Optional[int]:
         candidate_scores: List[Tuple[int, int, int]] = []  # (idx, u_count, text_count)
-        for col_idx in range(ws.max_column):
-            u_count = 0
-            text_count = 0
-            for cell in ws.iter_rows(min_row=2, min_col=col_idx + 1, max_col=col_idx + 1, values_only=True):
-                value = cell[0]
-                if value is None:
-                    continue
-                text = str(value).strip()
-                if not text:
-                    continue
-                text_count += 1
-                if text.upper().startswith("U"):
-                    u_count += 1
-            if text_count:
-                candidate_scores.append((col_idx, u_count, text_count))
+        # zip(*rows) 在 C 层完成行列转置，之后按整列统计
+        for col_idx, column in enumerate(zip(*rows[1:])):
+            texts = [
+                text
+                for text in (str(value).strip() for value in column if value is not None)
+                if text
+            ]
+            if texts:
+                u_count = sum(1 for text in texts if text[0] in "Uu")
+                candidate_scores.append((col_idx, u_count, len(texts)))
         if not candidate_scores:
             return None
         candidate_scores.sort(key=lambda item: (-item[1], -item[2]))
         return candidate_scores[0][0]
 
-    def _identify_description_column(self, ws: Worksheet, part_col_idx: Optional[int]) -> Optional[int]:
-        for header_row in ws.iter_rows(min_row=1, max_row=min(5, ws.max_row)):
-            for idx, cell in enumerate(header_row):
-                value = cell.value if isinstance(cell, Cell) else cell
+    def _identify_description_column(
+        self, rows: List[Tuple], part_col_idx: Optional[int]
+    ) -> Optional[int]:
+        for header_row in rows[:5]:
+            for idx, value in enumerate(header_row):
                 if isinstance(value, str):
                     lowered = value.strip().lower()
                     if lowered and ("desc" in lowered or "描述" in lowered):
                         return idx
-        if part_col_idx is not None and part_col_idx + 1 < ws.max_column:
+        max_col = len(rows[0]) if rows else 0
+        if part_col_idx is not None and part_col_idx + 1 < max_col:
             return part_col_idx + 1
         return None
 
@@ -889,6 +971,10 @@ class ExcelProcessor:
         used_parts: set[str] = set()
         index_consumption: Dict[str, float] = defaultdict(float)
         debug_logs: List[str] = []
+        # 条件判断只关心料号是否有库存，预先求出集合后用集合运算判定
+        present_parts = frozenset(
+            part_no for part_no, quantity in part_quantities.items() if quantity and quantity > 0
+        )
 
         for project in binding_library.iter_projects():
             index_candidates = self._resolve_index_candidates(
@@ -910,7 +996,7 @@ class ExcelProcessor:
                 and not (project.index_part_desc or "").strip()
             ):
                 group_candidates = self._resolve_group_based_candidates(
-                    project, part_quantities, part_display
+                    project, part_quantities, part_display, present_parts
                 )
                 if group_candidates:
                     candidate_entries.extend(group_candidates)
@@ -962,6 +1048,7 @@ class ExcelProcessor:
                         available_inventory,
                         part_quantities,
                         part_display,
+                        present_parts,
                     )
                     group_results.append(result)
 
@@ -999,12 +1086,17 @@ class ExcelProcessor:
         available_inventory: Dict[str, float],
         reference_quantities: Dict[str, float],
         part_display: Dict[str, str],
+        present_parts: frozenset[str],
     ) -> RequirementGroupResult:
-        base_requirement = group.number if group.number not in (None, "") else 1.0
-        try:
-            base_requirement = float(base_requirement)
-        except (TypeError, ValueError):
-            base_requirement = 1.0
+        base_requirement = group.number
+        # 绑定库加载时分组数量已解析为 float，只有异常值才需要再次转换
+        if type(base_requirement) is not float:
+            if base_requirement in (None, ""):
+                base_requirement = 1.0
+            try:
+                base_requirement = float(base_requirement)
+            except (TypeError, ValueError):
+                base_requirement = 1.0
 
         required_qty = project_qty * base_requirement
         available_qty = 0.0
@@ -1018,7 +1110,7 @@ class ExcelProcessor:
         for idx, choice in enumerate(group.choices):
             if not choice.part_no:
                 continue
-            if not self._choice_condition_met(choice, reference_quantities):
+            if not self._choice_condition_met(choice, present_parts):
                 continue
 
             requirement_enabled = True
@@ -1028,8 +1120,10 @@ class ExcelProcessor:
             total_stock = reference_quantities.get(choice_key, 0.0)
             if total_stock > 0:
                 available_qty += total_stock
-            stock = max(available_inventory.get(choice_key, 0.0), 0.0)
-            applicable_choices.append((idx, choice, choice_key, stock))
+            stock = available_inventory.get(choice_key, 0.0)
+            # 分配过程中库存只减不增，当前无库存的料号不会被取用，不参与排序与分配
+            if stock > 0:
+                applicable_choices.append((idx, choice, choice_key, stock))
             if first_applicable_part is None:
                 first_applicable_part = choice.part_no
 
@@ -1043,25 +1137,29 @@ class ExcelProcessor:
                 matched_details={},
             )
 
-        applicable_choices.sort(key=lambda item: (-item[3], item[0]))
+        # 列表按原始顺序构建，稳定排序后库存相同的料号仍保持原顺序
+        applicable_choices.sort(key=itemgetter(3), reverse=True)
 
-        for _idx, choice, choice_key, stock in applicable_choices:
-            remaining_need = max(required_qty - fulfilled_qty, 0.0)
+        # 贪心分配：库存与剩余需求都为正时才取料，取料量不超过两者较小值，
+        # 因此扣减后的库存不会为负，无需再做 max(…, 0) 钳位
+        get_stock = available_inventory.get
+        remaining_need = required_qty
+        for _idx, choice, choice_key, _stock in applicable_choices:
             if remaining_need <= 0:
                 break
 
-            current_stock = max(available_inventory.get(choice_key, 0.0), 0.0)
+            current_stock = get_stock(choice_key, 0.0)
             if current_stock <= 0:
                 continue
 
             take_amount = min(current_stock, remaining_need)
-            if take_amount <= 0:
-                continue
 
+            # part_display 的取值在读取 BOM 时已驻留，绑定库料号在加载时已驻留
             display_no = part_display.get(choice_key, choice.part_no)
             matched_details[display_no] = matched_details.get(display_no, 0.0) + take_amount
             fulfilled_qty += take_amount
-            available_inventory[choice_key] = max(current_stock - take_amount, 0.0)
+            remaining_need = required_qty - fulfilled_qty
+            available_inventory[choice_key] = current_stock - take_amount
 
         missing_qty = max(required_qty - fulfilled_qty, 0.0)
         missing_choices: List[str] = []
@@ -1088,29 +1186,30 @@ class ExcelProcessor:
                 return choice.desc
         return ""
 
-    def _choice_condition_met(self, choice, part_quantities: Dict[str, float]) -> bool:
-        mode = (choice.condition_mode or "").upper()
+    def _choice_condition_met(self, choice, present_parts: frozenset[str]) -> bool:
+        cached = self._condition_cache.get(id(choice))
+        if cached is None:
+            cached = (
+                (choice.condition_mode or "").upper(),
+                frozenset(
+                    normalize_part_no(part_no)
+                    for part_no in choice.condition_part_nos
+                    if part_no not in (None, "")
+                ),
+            )
+            self._condition_cache[id(choice)] = cached
+        mode, condition_keys = cached
         if not mode:
             return True
-
-        condition_keys = [
-            normalize_part_no(part_no)
-            for part_no in choice.condition_part_nos
-            if part_no not in (None, "")
-        ]
         if not condition_keys:
             return False
 
-        def _has_part(part_no: str) -> bool:
-            quantity = part_quantities.get(part_no, 0.0)
-            return bool(quantity and quantity > 0)
-
         if mode == "ALL":
-            return all(_has_part(part_no) for part_no in condition_keys)
+            return condition_keys <= present_parts
         if mode == "ANY":
-            return any(_has_part(part_no) for part_no in condition_keys)
+            return not condition_keys.isdisjoint(present_parts)
         if mode == "NOTANY":
-            return not any(_has_part(part_no) for part_no in condition_keys)
+            return condition_keys.isdisjoint(present_parts)
         return True
 
     def _resolve_index_candidates(
@@ -1154,6 +1253,7 @@ class ExcelProcessor:
         project,
         part_quantities: Dict[str, float],
         part_display: Dict[str, str],
+        present_parts: frozenset[str],
     ) -> List[Tuple[str, str, float]]:
         candidates: List[Tuple[str, str, float]] = []
         seen: set[str] = set()
@@ -1167,7 +1267,7 @@ class ExcelProcessor:
                 if not part_key or part_key in seen:
                     continue
 
-                if not self._choice_condition_met(choice, part_quantities):
+                if not self._choice_condition_met(choice, present_parts):
                     continue
 
                 qty = part_quantities.get(part_key, 0.0)
@@ -1205,12 +1305,19 @@ class ExcelProcessor:
             if line.strip()
         ]
         part_variant_cache: Dict[str, set[str]] = {}
+        if keywords:
+            part_variant_cache = self._batch_part_variants(
+                [part_no for part_no, qty in available_inventory.items() if qty > 0],
+                part_display,
+                part_descriptions,
+            )
 
         for keyword in keywords:
             normalized_keyword = normalize_text(keyword)
             keyword_variants = normalized_variants(keyword)
             if normalized_keyword:
                 keyword_variants.add(normalized_keyword)
+            variants_match = self._build_variants_matcher(keyword_variants)
 
             total_qty = 0.0
             matched_detail: Dict[str, float] = {}
@@ -1218,16 +1325,8 @@ class ExcelProcessor:
             for part_no, qty in available_inventory.items():
                 if qty <= 0:
                     continue
-                variants = part_variant_cache.get(part_no)
-                if variants is None:
-                    variants = self._collect_part_variants(
-                        part_display.get(part_no, part_no),
-                        part_no,
-                        part_descriptions.get(part_no, ""),
-                    )
-                    part_variant_cache[part_no] = variants
-
-                if not self._variants_match(keyword_variants, variants):
+                variants = part_variant_cache[part_no]
+                if not variants_match(variants):
                     continue
 
                 display_no = part_display.get(part_no, part_no)
@@ -1358,10 +1457,13 @@ class ExcelProcessor:
         summary_ws.append([])
         summary_ws.append(["重要物料余量"])
         summary_ws.append(["料号", "描述", "剩余数量"])
-        for part_no, desc, qty in important_part_rows:
-            summary_ws.append(
-                [part_no, desc, format_quantity_cell(qty)]
-            )
+        # 重要物料余量同时写入汇总表和“重要物料”表，只格式化一次
+        important_output_rows = [
+            (part_no, desc, format_quantity_cell(qty))
+            for part_no, desc, qty in important_part_rows
+        ]
+        for row in important_output_rows:
+            summary_ws.append(row)
 
         summary_ws.append([])
         summary_ws.append(["调试信息"])
@@ -1370,34 +1472,54 @@ class ExcelProcessor:
 
         important_ws = wb.create_sheet("重要物料")
         important_ws.append(["料号", "描述", "剩余数量"])
-        for part_no, desc, qty in important_part_rows:
-            important_ws.append([part_no, desc, format_quantity_cell(qty)])
+        for row in important_output_rows:
+            important_ws.append(row)
 
         remainder_ws = wb.create_sheet("剩余物料")
         remainder_ws.append(["料号", "描述", "剩余数量"])
         for part_no, desc, qty in remainder_rows:
-            remainder_ws.append([part_no, desc, format_quantity_cell(qty)])
-
-    def _collect_part_variants(self, display_no: str, part_no: str, description: str) -> set[str]:
-        variants: set[str] = set()
-        variants.update(normalized_variants(display_no))
-        variants.update(normalized_variants(part_no))
-        if description:
-            variants.update(normalized_variants(description))
-        return variants
-
-    def _variants_match(self, keyword_variants: set[str], value_variants: set[str]) -> bool:
-        if not keyword_variants or not value_variants:
-            return False
-        for keyword_variant in keyword_variants:
-            if not keyword_variant:
-                continue
+            remainder_ws.append((part_no, desc, format_quantity_cell(qty)))
+
+    def _batch_part_variants(
+        self,
+        part_numbers: List[str],
+        part_display: Dict[str, str],
+        part_descriptions: Dict[str, str],
+    ) -> Dict[str, set[str]]:
+        # 所有料号、显示料号与描述拼成一批，繁简转换各只调用一次 OpenCC
+        values: List[str] = []
+        for part_no in part_numbers:
+            values.append(part_display.get(part_no, part_no))
+            values.append(part_no)
+            values.append(part_descriptions.get(part_no, ""))
+        converted = normalized_variants_batch(values)
+        cache: Dict[str, set[str]] = {}
+        for offset, part_no in enumerate(part_numbers):
+            base = offset * 3
+            cache[part_no] = converted[base] | converted[base + 1] | converted[base + 2]
+        return cache
+
+    def _build_variants_matcher(self, keyword_variants: set[str]) -> Callable[[set[str]], bool]:
+        """把关键字的各个变体编译成一个正则，匹配时每个料号变体只扫描一次。
+
+        判定规则与逐对比较一致：关键字变体包含于料号变体，或料号变体包含于关键字变体。
+        """
+        keywords = sorted((item for item in keyword_variants if item), key=len, reverse=True)
+        if not keywords:
+            return lambda value_variants: False
+        pattern = re.compile("|".join(map(re.escape, keywords)))
+        # 单元格文本不会含 NUL，用它拼接后一次 in 判断即可覆盖所有关键字变体
+        keyword_text = "\0".join(keywords)
+
+        def _match(value_variants: set[str]) -> bool:
             for value_variant in value_variants:
                 if not value_variant:
                     continue
-                if keyword_variant in value_variant or value_variant in keyword_variant:
+                if pattern.search(value_variant) or value_variant in keyword_text:
                     return True
-        return False
+            return False
+
+        return _match
 
     def _format_column_debug(self, col_idx: Optional[int]) -> str:
         if col_idx is None:
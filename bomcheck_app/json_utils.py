@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(raw: bytes | str) -> Any:
+    # orjson.JSONDecodeError 继承自 json.JSONDecodeError，调用方只需捕获后者
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
+def json_dumps(payload: Any) -> bytes:
+    # 输出两格缩进、保留中文的 UTF-8 字节，可直接 write_bytes
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplacementRecord:
     invalid_part_no: str
     invalid_desc: str
@@ -14,7 +14,7 @@ class ReplacementRecord:
     row_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplacementSummary:
     total_invalid_found: int = 0
     total_invalid_previously_marked: int = 0
@@ -22,7 +22,7 @@ class ReplacementSummary:
     records: List[ReplacementRecord] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RequirementGroupResult:
     group_name: str
     required_qty: float
@@ -32,7 +32,7 @@ class RequirementGroupResult:
     matched_details: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BindingProjectResult:
     project_desc: str
     index_part_no: str
@@ -41,10 +41,13 @@ class BindingProjectResult:
 
     @property
     def has_missing(self) -> bool:
-        return any(group.missing_qty > 0 for group in self.requirement_results)
+        for group in self.requirement_results:
+            if group.missing_qty > 0:
+                return True
+        return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportantMaterialHit:
     keyword: str
     converted_keyword: str
@@ -52,14 +55,14 @@ class ImportantMaterialHit:
     matched_parts: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingItem:
     part_no: str
     desc: str
     missing_qty: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     replacement_summary: ReplacementSummary
     binding_results: List[BindingProjectResult]
@@ -69,4 +72,9 @@ class ExecutionResult:
 
     @property
     def has_missing(self) -> bool:
-        return bool(self.missing_items) or any(result.has_missing for result in self.binding_results)
+        if self.missing_items:
+            return True
+        for result in self.binding_results:
+            if result.has_missing:
+                return True
+        return False
@@ -6,6 +6,7 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
 import webbrowser
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -17,6 +18,10 @@ from PIL import Image
 
 from .excel_processor import normalize_part_no
 
+# 同时进行的图片下载数上限，与搜索并发分开控制
+_MAX_CONCURRENT_DOWNLOADS = 8
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 @dataclass
 class PartAsset:
@@ -47,11 +52,15 @@ class PartAsset:
 
 
 class PartAssetStore:
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, session: requests.Session | None = None) -> None:
         self.root = root
+        self._session = session or requests.Session()
         self.root.mkdir(parents=True, exist_ok=True)
         self.index_path = self.root / "assets.json"
         self.assets: Dict[str, PartAsset] = {}
+        # 自动生成会在多个线程中同时写入资源索引
+        self._lock = threading.RLock()
+        self._download_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_DOWNLOADS)
         self._load()
 
     def _load(self) -> None:
@@ -69,10 +78,11 @@ class PartAssetStore:
         }
 
     def save(self) -> None:
-        payload = {key: asset.to_dict() for key, asset in self.assets.items()}
-        self.index_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        with self._lock:
+            payload = {key: asset.to_dict() for key, asset in self.assets.items()}
+            self.index_path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
 
     def get(self, part_no: str) -> PartAsset | None:
         normalized = normalize_part_no(part_no)
@@ -91,8 +101,9 @@ class PartAssetStore:
         if not normalized:
             raise ValueError("无效的料号")
         asset.part_no = normalized
-        self.assets[normalized] = asset
-        self.save()
+        with self._lock:
+            self.assets[normalized] = asset
+            self.save()
 
     def remove(self, part_no: str) -> None:
         normalized = normalize_part_no(part_no)
@@ -129,21 +140,38 @@ class PartAssetStore:
         asset.remote_links = links
         self.upsert(asset)
 
-    def download_image(self, part_no: str, url: str) -> str:
+    def download_image(self, part_no: str, url: str, replace: bool = False) -> str:
         asset = self._ensure(part_no)
         file_name = _safe_filename(urlparse(url).path.rsplit("/", 1)[-1]) or "image"
         extension = _guess_extension(file_name)
         target = self._generate_unique_path(asset.part_no, f"{file_name}{extension}")
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        target.write_bytes(response.content)
-        asset.images.append(str(target.relative_to(self.root)))
+        # 边下载边写入临时文件，完整下载后再改名，避免大图整体驻留内存或留下残缺文件
+        temp_path = target.with_name(f"{target.name}.part")
+        with self._download_slots:
+            with self._session.get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                try:
+                    with temp_path.open("wb") as handle:
+                        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            if chunk:
+                                handle.write(chunk)
+                    os.replace(temp_path, target)
+                except BaseException:
+                    temp_path.unlink(missing_ok=True)
+                    raise
+        relative = str(target.relative_to(self.root))
+        if replace:
+            asset.images = [relative]
+        else:
+            asset.images.append(relative)
         self.upsert(asset)
-        return str(target.relative_to(self.root))
+        return relative
 
-    def download_first_image_from_search(self, part_no: str, keyword: str) -> str | None:
+    def download_first_image_from_search(
+        self, part_no: str, keyword: str, replace: bool = False
+    ) -> str | None:
         url = "https://www.bing.com/images/search"
-        response = requests.get(
+        response = self._session.get(
             url,
             params={"q": keyword},
             headers={"User-Agent": "Mozilla/5.0"},
@@ -155,7 +183,7 @@ class PartAssetStore:
             return None
         image_url = match.group(1).replace("\\/", "/")
         try:
-            return self.download_image(part_no, image_url)
+            return self.download_image(part_no, image_url, replace=replace)
         except Exception:
             return None
 
@@ -163,12 +191,13 @@ class PartAssetStore:
         normalized = normalize_part_no(part_no)
         if not normalized:
             raise ValueError("无效的料号")
-        existing = self.assets.get(normalized)
-        if existing:
-            return existing
-        asset = PartAsset(part_no=normalized)
-        self.assets[normalized] = asset
-        return asset
+        with self._lock:
+            existing = self.assets.get(normalized)
+            if existing:
+                return existing
+            asset = PartAsset(part_no=normalized)
+            self.assets[normalized] = asset
+            return asset
 
     def _copy_to_part_folder(self, part_no: str, source: Path) -> str:
         part_folder = self.root / part_no
@@ -13,6 +13,14 @@ from .excel_processor import format_quantity_text, normalize_part_no
 from .text_utils import normalize_text, normalized_variants
 
 
+class CategoryNode:
+    __slots__ = ("parts", "children")
+
+    def __init__(self) -> None:
+        self.parts: list[SystemPartRecord] = []
+        self.children: Dict[str, CategoryNode] = {}
+
+
 @dataclass
 class SystemPartRecord:
     part_no: str
@@ -85,7 +93,7 @@ class SystemPartRepository:
         return self.path
 
     def _convert_excel_to_tsv(self, source: Path, destination: Path) -> None:
-        workbook = load_workbook(source, data_only=True, read_only=True)
+        workbook = load_workbook(source, data_only=True, read_only=True, keep_links=False)
         sheet = workbook.active
         destination.parent.mkdir(parents=True, exist_ok=True)
         with destination.open("w", encoding="utf-8", newline="") as handle:
@@ -100,17 +108,20 @@ class SystemPartRepository:
             return None
         return self._index.get(normalized)
 
-    def build_hierarchy(self, query: str | None = None) -> Dict[str, Dict]:
+    def build_hierarchy(self, query: str | None = None) -> CategoryNode:
         keywords = _prepare_keywords(query)
-        root: Dict[str, Dict] = {"children": {}, "parts": []}
+        root = CategoryNode()
 
         for record in self.records:
             if keywords and not _matches_query(record, keywords):
                 continue
             node = root
             for category in record.categories:
-                node = node["children"].setdefault(category, {"children": {}, "parts": []})
-            node.setdefault("parts", []).append(record)
+                child = node.children.get(category)
+                if child is None:
+                    child = node.children[category] = CategoryNode()
+                node = child
+            node.parts.append(record)
 
         return root
 
@@ -172,9 +183,8 @@ def generate_system_part_excel(
 
 
 def _write_excel(records: list[SystemPartRecord], destination: Path) -> None:
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "系统料号"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("系统料号")
     sheet.append(["料号", "描述", "单位", "申请人", "库存"])
 
     for record in records:
@@ -248,7 +258,7 @@ def _parse_tsv(path: Path) -> list[SystemPartRecord]:
 
 
 def _parse_excel(path: Path) -> list[SystemPartRecord]:
-    workbook = load_workbook(path, data_only=True, read_only=True)
+    workbook = load_workbook(path, data_only=True, read_only=True, keep_links=False)
     sheet = workbook.active
     records: list[SystemPartRecord] = []
     for row in sheet.iter_rows(min_row=2, values_only=True):
@@ -307,7 +317,7 @@ def _format_inventory_cell(value: float | None):
 def _load_invalid_part_numbers(path: Path) -> set[str]:
     if not path.exists():
         return set()
-    workbook = load_workbook(path, data_only=True, read_only=True)
+    workbook = load_workbook(path, data_only=True, read_only=True, keep_links=False)
     sheet = workbook.active
     invalid_numbers: set[str] = set()
     for row in sheet.iter_rows(min_row=2, values_only=True):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Iterable, List
 
 MODES = ("t2s", "s2t")
 
@@ -28,6 +29,9 @@ def _prepare_value(value: str | object) -> str:
 
 def normalize_text(value: str) -> str:
     base = _prepare_value(value)
+    if base.isascii():
+        # 纯 ASCII 文本繁简转换前后一致，跳过 OpenCC
+        return base
     converter = _get_converter("t2s")
     if converter:
         try:
@@ -44,6 +48,8 @@ def normalized_variants(value: str) -> set[str]:
     base = _prepare_value(value)
     if base:
         variants.add(base)
+    if base.isascii():
+        return variants
     for mode in MODES:
         converter = _get_converter(mode)
         if not converter:
@@ -56,3 +62,33 @@ def normalized_variants(value: str) -> set[str]:
         if normalized:
             variants.add(normalized)
     return variants
+
+
+_BATCH_SEPARATOR = "\x1f"
+
+
+def normalized_variants_batch(values: Iterable[str | object]) -> List[set[str]]:
+    """批量版 normalized_variants：每种模式只调用一次 OpenCC。"""
+    bases = [_prepare_value(value) for value in values]
+    results: List[set[str]] = [{base} if base else set() for base in bases]
+    # 纯 ASCII 文本转换前后一致，只把含非 ASCII 字符的文本交给 OpenCC
+    pending = [index for index, base in enumerate(bases) if not base.isascii()]
+    if not pending:
+        return results
+    joined = _BATCH_SEPARATOR.join(bases[index] for index in pending)
+    for mode in MODES:
+        converter = _get_converter(mode)
+        if not converter:
+            continue
+        try:
+            converted_parts = converter.convert(joined).split(_BATCH_SEPARATOR)
+        except Exception:  # pragma: no cover - opencc failure
+            continue
+        if len(converted_parts) != len(pending):
+            # 原文本自身含分隔符时无法对齐，退回逐条转换
+            return [normalized_variants(value) for value in bases]
+        for index, converted in zip(pending, converted_parts):
+            normalized = _prepare_value(converted)
+            if normalized:
+                results[index].add(normalized)
+    return results
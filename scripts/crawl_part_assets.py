@@ -42,7 +42,7 @@ def parse_args() -> argparse.Namespace:
         "--progress",
         type=Path,
         default=None,
-        help="自定义进度文件路径，默认为资产目录下 crawl_progress.json",
+        help="自定义进度文件路径，默认为资产目录下 crawl_progress.jsonl",
     )
     parser.add_argument(
         "--delay",
@@ -50,6 +50,12 @@ def parse_args() -> argparse.Namespace:
         default=1.0,
         help="每个任务之间的等待秒数，避免频繁请求触发风控",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="同时处理的料号数，默认 1；增大后对搜索引擎的请求频率会成倍提高",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -73,6 +79,7 @@ def main() -> None:
         args.progress,
         delay_seconds=args.delay,
         ua_lookup_dir=args.ua_dir,
+        max_workers=args.workers,
     )
     crawler.add_tasks(parts)
     pending = crawler.pending()